@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+import logging
+import os
 import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
-from src.utils import get_logger
+from src.utils import get_logger, write_json
 
 _logger = get_logger(__name__)
 
@@ -44,29 +49,40 @@ _PEDRA_COLUMNS: tuple[str, ...] = (
     "Pedra 2024",
 )
 
+# Free-text columns where distinct values approach row count; factorizing them buys nothing.
+_HIGH_CARDINALITY_COLUMNS: frozenset[str] = frozenset({"Turma", "Fase_Ideal"})
+
 _FASE_RE = re.compile(r"^FASE\s*([1-8])$", flags=re.IGNORECASE)
 
 
+def _normalize_text_value(text: str) -> str | None:
+    # ASCII text is already in NFC; only non-ASCII values pay for unicodedata.
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text)
+    # split()/join collapses whitespace runs and trims ends without the regex engine.
+    collapsed = " ".join(text.split())
+    return collapsed or None
+
+
 def normalize_text_series(series: pd.Series) -> pd.Series:
     """Normalize textual values while preserving missing values as NA."""
-    normalized = series.astype("string")
-    normalized = normalized.str.normalize("NFC")
-    normalized = normalized.str.replace(r"\s+", " ", regex=True).str.strip()
-    normalized = normalized.mask(normalized == "", pd.NA)
-    return normalized
+    # One fused pass per value instead of materializing a StringArray per pipeline step.
+    values = series.astype("string").to_numpy(dtype=object, na_value=None)
+    normalized = [None if value is None else _normalize_text_value(value) for value in values]
+    return pd.Series(
+        pd.array(normalized, dtype="string"),
+        index=series.index,
+        name=series.name,
+    )
 
 
 def _casefold_map(series: pd.Series, mapping: dict[str, str | pd.NA]) -> pd.Series:
     normalized = normalize_text_series(series)
-
-    def transform(value: object) -> object:
-        if pd.isna(value):
-            return pd.NA
-        text = str(value)
-        return mapping.get(text.casefold(), text)
-
-    transformed = normalized.map(transform)
-    return transformed.astype("string")
+    key = normalized.str.casefold()
+    # Membership mask keeps NA-valued mappings (e.g. "incluir") distinct from misses.
+    hit = key.isin(list(mapping)).fillna(False).astype(bool)
+    mapped = key.map(mapping).astype("string")
+    return mapped.where(hit, normalized).astype("string")
 
 
 def _normalize_genero(series: pd.Series) -> pd.Series:
@@ -111,43 +127,93 @@ def _normalize_turma(series: pd.Series) -> pd.Series:
 
 def _normalize_fase(series: pd.Series) -> pd.Series:
     normalized = normalize_text_series(series)
-
-    def transform(value: object) -> object:
-        if pd.isna(value):
-            return pd.NA
-        text = str(value)
-        if text.casefold() == "alfa":
-            return "ALFA"
-        match = _FASE_RE.fullmatch(text)
-        if match:
-            return f"Fase {match.group(1)}"
-        return text
-
-    transformed = normalized.map(transform)
-    return transformed.astype("string")
+    fase_number = normalized.str.extract(_FASE_RE, expand=False)
+    result = normalized.mask(fase_number.notna(), "Fase " + fase_number)
+    is_alfa = (normalized.str.casefold() == "alfa").fillna(False).astype(bool)
+    result = result.mask(is_alfa, "ALFA")
+    return result.astype("string")
 
 
 def _normalize_fase_ideal(series: pd.Series) -> pd.Series:
     normalized = normalize_text_series(series)
-    normalized = normalized.str.replace("°", "º", regex=False)
-    normalized = normalized.str.replace(r"\s+", " ", regex=True).str.strip()
-    return normalized
+    # Input is already whitespace-collapsed and the ordinal swap adds no whitespace.
+    return normalized.str.replace("°", "º", regex=False)
+
+
+_NORMALIZERS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "Gênero": _normalize_genero,
+    "Instituição de ensino": _normalize_instituicao,
+    "Turma": _normalize_turma,
+    "Fase": _normalize_fase,
+    "Fase_Ideal": _normalize_fase_ideal,
+    **{column: _normalize_pedra for column in _PEDRA_COLUMNS},
+}
+
+
+def _normalize_distinct_values(
+    series: pd.Series,
+    normalizer: Callable[[pd.Series], pd.Series],
+) -> tuple[pd.Series, int]:
+    """Apply normalizer to distinct values only and broadcast back through codes.
+
+    Also returns the number of changed cells, counted per distinct value and
+    weighted by row frequency instead of comparing every row.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categories are already the distinct values; reuse codes without rehashing rows.
+        codes = series.cat.codes.to_numpy()
+        uniques = series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    raw_uniques = pd.Series(uniques, dtype=object)
+    normalized_uniques = normalizer(raw_uniques).astype("string")
+    values = normalized_uniques.array.take(codes, allow_fill=True)
+    after = pd.Series(values, index=series.index, name=series.name, dtype="string")
+
+    changed_uniques = _changed_mask(raw_uniques, normalized_uniques)
+    rows_per_unique = np.bincount(codes[codes >= 0], minlength=len(raw_uniques))
+    n_changed = int(rows_per_unique[changed_uniques].sum())
+    return after, n_changed
+
+
+def _as_string(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    return series.astype("string")
 
 
 def _top_counts(series: pd.Series, limit: int = 10) -> list[dict[str, int | str]]:
-    counts = series.astype("string").value_counts(dropna=False).head(limit)
-    result: list[dict[str, int | str]] = []
-    for label, count in counts.items():
-        item_label = "<NA>" if pd.isna(label) else str(label)
-        result.append({"label": item_label, "count": int(count)})
-    return result
+    # Partial top-k selection instead of fully sorting every distinct value.
+    counts = _as_string(series).value_counts(dropna=False, sort=False).nlargest(limit)
+    return [
+        {"label": "<NA>" if pd.isna(label) else str(label), "count": int(count)}
+        for label, count in counts.items()
+    ]
+
+
+def _changed_mask(before: pd.Series, after: pd.Series) -> np.ndarray:
+    # With NA as None, one elementwise comparison covers value changes and NA flips.
+    before_values = _as_string(before).to_numpy(dtype=object, na_value=None)
+    after_values = _as_string(after).to_numpy(dtype=object, na_value=None)
+    return before_values != after_values
 
 
 def _count_changed(before: pd.Series, after: pd.Series) -> int:
-    before_s = before.astype("string")
-    after_s = after.astype("string")
-    equal = (before_s == after_s) | (before_s.isna() & after_s.isna())
-    return int((~equal.fillna(False)).sum())
+    return int(np.count_nonzero(_changed_mask(before, after)))
+
+
+_NormalizedSource = tuple[Callable[[pd.Series], pd.Series], pd.Series, pd.Series, int]
+
+
+def _find_normalized_source(
+    sources: list[_NormalizedSource],
+    normalizer: Callable[[pd.Series], pd.Series],
+    before: pd.Series,
+) -> tuple[pd.Series, int] | None:
+    for cached_normalizer, cached_before, cached_after, cached_changed in sources:
+        if cached_normalizer is normalizer and cached_before.equals(before):
+            return cached_after, cached_changed
+    return None
 
 
 def normalize_categories(
@@ -157,34 +223,33 @@ def normalize_categories(
 ) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Normalize configured category columns for a single year dataframe."""
     log = logger or _logger
-    normalized_df = df.copy()
+    new_columns: dict[str, pd.Series] = {}
     columns_report: dict[str, dict[str, Any]] = {}
     total_changed = 0
 
-    for column in CATEGORY_COLUMNS:
-        if column not in normalized_df.columns:
-            continue
-
-        before = normalized_df[column].copy()
-
-        if column == "Gênero":
-            after = _normalize_genero(before)
-        elif column == "Instituição de ensino":
-            after = _normalize_instituicao(before)
-        elif column in _PEDRA_COLUMNS:
-            after = _normalize_pedra(before)
-        elif column == "Turma":
-            after = _normalize_turma(before)
-        elif column == "Fase":
-            after = _normalize_fase(before)
-        elif column == "Fase_Ideal":
-            after = _normalize_fase_ideal(before)
+    # Identical source columns (e.g. "Ativo/ Inativo" and its __dup1) are normalized once.
+    normalized_sources: list[_NormalizedSource] = []
+
+    present_columns = [column for column in CATEGORY_COLUMNS if column in df.columns]
+    for column in present_columns:
+        # Read-only access: normalizers and report helpers never mutate their input.
+        before = df[column]
+
+        normalizer = _NORMALIZERS.get(column, normalize_text_series)
+        reused = _find_normalized_source(normalized_sources, normalizer, before)
+        if reused is not None:
+            after, n_changed = reused
+        elif column in _HIGH_CARDINALITY_COLUMNS and not isinstance(
+            before.dtype, pd.CategoricalDtype
+        ):
+            after = normalizer(before)
+            n_changed = _count_changed(before, after)
+            normalized_sources.append((normalizer, before, after, n_changed))
         else:
-            after = normalize_text_series(before)
+            after, n_changed = _normalize_distinct_values(before, normalizer)
+            normalized_sources.append((normalizer, before, after, n_changed))
 
-        normalized_df[column] = after
-
-        n_changed = _count_changed(before, after)
+        new_columns[column] = after
         total_changed += n_changed
         columns_report[column] = {
             "n_changed": n_changed,
@@ -192,25 +257,27 @@ def normalize_categories(
             "top_after": _top_counts(after, limit=10),
         }
 
+    normalized_df = df.assign(**new_columns)
+
     year_report = {
         "year": year,
         "total_changed": total_changed,
         "columns": columns_report,
     }
 
-    top_changed = sorted(
-        ((col, info["n_changed"]) for col, info in columns_report.items()),
-        key=lambda item: item[1],
-        reverse=True,
-    )[:5]
-
-    log.info(
-        "Category normalization year=%d | columns=%d total_changed=%d top_changed=%s",
-        year,
-        len(columns_report),
-        total_changed,
-        top_changed,
-    )
+    if log.isEnabledFor(logging.INFO):
+        top_changed = heapq.nlargest(
+            5,
+            ((col, info["n_changed"]) for col, info in columns_report.items()),
+            key=lambda item: item[1],
+        )
+        log.info(
+            "Category normalization year=%d | columns=%d total_changed=%d top_changed=%s",
+            year,
+            len(columns_report),
+            total_changed,
+            top_changed,
+        )
 
     return normalized_df, year_report
 
@@ -218,13 +285,30 @@ def normalize_categories(
 def normalize_categories_all(
     dfs: dict[int, pd.DataFrame],
     logger=None,
+    max_workers: int | None = None,
 ) -> tuple[dict[int, pd.DataFrame], dict[int, dict[str, Any]]]:
-    """Normalize category columns for all yearly dataframes."""
+    """Normalize category columns for all yearly dataframes.
+
+    Years are independent, so `max_workers > 1` fans them out to a process pool.
+    Workers log through the module logger because logger objects are not picklable.
+    """
     log = logger or _logger
+    years = sorted(dfs)
     normalized: dict[int, pd.DataFrame] = {}
     report: dict[int, dict[str, Any]] = {}
 
-    for year in sorted(dfs):
+    if max_workers is not None and max_workers > 1 and len(years) > 1:
+        workers = min(max_workers, len(years), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                year: executor.submit(normalize_categories, dfs[year], year)
+                for year in years
+            }
+            for year in years:
+                normalized[year], report[year] = futures[year].result()
+        return normalized, report
+
+    for year in years:
         normalized[year], report[year] = normalize_categories(
             dfs[year],
             year=year,
@@ -275,7 +359,7 @@ def persist_category_normalization_report(
     }
 
     json_path = output_path / "category_normalization_report.json"
-    json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json(json_path, payload)
 
     if write_markdown:
         md_path = output_path / "category_normalization_report.md"
@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import argparse
-import json
+import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from src.utils import get_logger, setup_logging
+from src.utils import get_logger, setup_logging, write_json
 
 _logger = get_logger(__name__)
 
@@ -33,11 +34,14 @@ def compute_ra_sets(dfs: dict[int, pd.DataFrame]) -> tuple[dict[int, set[str]],
                 f"Coluna RA ausente para year={year}. Colunas disponíveis: {list(df.columns)}"
             )
 
-        ra = df["RA"].astype("string").str.strip()
-        invalid_mask = ra.isna() | (ra == "")
-        invalid_counts[year] = int(invalid_mask.sum())
-        valid = ra[~invalid_mask]
-        ra_sets[year] = set(valid.tolist())
+        # Deduplicate first so strip/blank checks run over distinct RAs, not every row.
+        codes, uniques = pd.factorize(df["RA"].astype("string"), use_na_sentinel=True)
+        stripped = pd.Series(uniques, dtype="string").str.strip()
+        blank = (stripped == "").to_numpy(dtype=bool)
+        rows_per_unique = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        invalid_counts[year] = int((codes < 0).sum() + rows_per_unique[blank].sum())
+        # Stripping can merge variants (" A" / "A"); collapse them in pandas before the set.
+        ra_sets[year] = set(stripped[~blank].unique())
 
     return ra_sets, invalid_counts
 
@@ -55,12 +59,13 @@ def compute_intersections(
 ) -> dict[str, Any]:
     """Compute aggregate intersection metrics for fixed year pairs."""
     selected_pairs = list(DEFAULT_PAIRS if pairs is None else pairs)
-    counts = {str(year): len(values) for year, values in sorted(ra_sets.items())}
-    invalid = {str(year): int(invalid_counts.get(year, 0)) for year in sorted(ra_sets)}
+    years = sorted(ra_sets)
+    counts = {str(year): len(ra_sets[year]) for year in years}
+    invalid = {str(year): int(invalid_counts.get(year, 0)) for year in years}
 
     report: dict[str, Any] = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "years": sorted(ra_sets),
+        "years": years,
         "counts": counts,
         "ra_invalid_discarded_count": invalid,
         "pairs": {},
@@ -69,13 +74,14 @@ def compute_intersections(
     for year_a, year_b in selected_pairs:
         if year_a not in ra_sets or year_b not in ra_sets:
             raise ValueError(
-                f"Par inválido ({year_a}, {year_b}). Anos disponíveis: {sorted(ra_sets)}"
+                f"Par inválido ({year_a}, {year_b}). Anos disponíveis: {years}"
             )
 
         set_a = ra_sets[year_a]
         set_b = ra_sets[year_b]
         intersection = len(set_a & set_b)
-        union = len(set_a | set_b)
+        # Inclusion-exclusion avoids materializing the union set.
+        union = len(set_a) + len(set_b) - intersection
         pair_key = f"{year_a}_{year_b}"
 
         report["pairs"][pair_key] = {
@@ -129,7 +135,7 @@ def persist_ra_intersections(
     output_path.mkdir(parents=True, exist_ok=True)
 
     json_path = output_path / "ra_intersections.json"
-    json_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json(json_path, report)
 
     md_path: Path | None = None
     if write_markdown:
@@ -191,6 +197,9 @@ def main() -> None:
         write_markdown=not args.no_markdown,
     )
 
+    if not _logger.isEnabledFor(logging.INFO):
+        return
+
     for pair_key, pair_stats in report["pairs"].items():
         year_a, year_b = pair_key.split("_")
         _logger.info(
@@ -62,16 +62,47 @@ def _aliases_for_year(canonical: str, year: int) -> list[str]:
     return list(OrderedDict.fromkeys(aliases))
 
 
-def _matched_columns(alias: str, columns: list[str], already_selected: set[str]) -> list[str]:
-    """Find columns matching alias, including duplicate suffixes."""
-    pattern = re.compile(rf"^{re.escape(alias)}(?:__dup\d+|\.\d+)?$")
-    matched: list[str] = []
-    for col in columns:
-        if col in already_selected:
+_DUP_SUFFIX_RE = re.compile(r"(?:__dup\d+|\.\d+)$")
+
+
+def _alias_priorities(year: int) -> dict[str, tuple[str, int]]:
+    """Map every alias of the year to its (canonical, priority) pair."""
+    lookup: dict[str, tuple[str, int]] = {}
+    for canonical in sorted(COLUMN_EQUIVALENCES):
+        for priority, alias in enumerate(_aliases_for_year(canonical, year)):
+            lookup.setdefault(alias, (canonical, priority))
+    return lookup
+
+
+def _bucket_columns_by_canonical(columns: list[str], year: int) -> dict[str, list[str]]:
+    """Classify columns in one pass, including duplicate suffixes (__dupN / .N).
+
+    Each bucket is ordered by alias priority and then by original column position.
+    """
+    lookup = _alias_priorities(year)
+    ranked: dict[str, list[tuple[int, int, str]]] = {}
+    for position, col in enumerate(columns):
+        # A column matches an alias either verbatim or with one duplicate suffix.
+        candidates = [col]
+        stripped = _DUP_SUFFIX_RE.sub("", col)
+        if stripped != col:
+            candidates.append(stripped)
+
+        best: tuple[str, int] | None = None
+        for candidate in candidates:
+            hit = lookup.get(candidate)
+            if hit is not None and (best is None or hit[1] < best[1]):
+                best = hit
+        if best is None:
             continue
-        if pattern.fullmatch(col):
-            matched.append(col)
-    return matched
+
+        canonical, priority = best
+        ranked.setdefault(canonical, []).append((priority, position, col))
+
+    return {
+        canonical: [col for _, _, col in sorted(entries)]
+        for canonical, entries in ranked.items()
+    }
 
 
 def harmonize_year_columns(
@@ -95,17 +126,14 @@ def harmonize_year_columns(
     }
 
     all_columns_ordered = [str(c) for c in harmonized.columns]
-    for canonical in sorted(COLUMN_EQUIVALENCES):
-        aliases = _aliases_for_year(canonical, year)
-        selected: list[str] = []
-        selected_set: set[str] = set()
+    buckets = _bucket_columns_by_canonical(all_columns_ordered, year)
+    drop_columns: list[str] = []
 
-        # Expand aliases with duplicate suffix variants while preserving alias priority.
-        for alias in aliases:
-            selected.extend(_matched_columns(alias, all_columns_ordered, selected_set))
-            selected_set.update(selected)
+    for canonical in sorted(COLUMN_EQUIVALENCES):
+        selected = buckets.get(canonical, [])
 
         if not selected:
+            aliases = _aliases_for_year(canonical, year)
             report["missing_aliases"][canonical] = aliases
             if strict:
                 raise ValueError(
@@ -114,10 +142,19 @@ def harmonize_year_columns(
                 )
             continue
 
-        merged = harmonized[selected[0]].copy()
-        for source_col in selected[1:]:
-            # Prefer first non-null value by priority without creating merge suffix artifacts.
-            merged = merged.where(merged.notna(), harmonized[source_col])
+        # Prefer first non-null value by priority without creating merge suffix artifacts.
+        if len(selected) == 1:
+            merged = harmonized[selected[0]]
+        elif harmonized.dtypes[selected].nunique() == 1:
+            # Homogeneous block: one backfill across priority order, no per-source temporaries.
+            # Opt out of object downcasting so the dtype matches the sequential merge.
+            with pd.option_context("future.no_silent_downcasting", True):
+                merged = harmonized[selected].bfill(axis=1)[selected[0]]
+        else:
+            # Mixed dtypes would collapse to object under bfill; keep first-column dtype rules.
+            merged = harmonized[selected[0]]
+            for source_col in selected[1:]:
+                merged = merged.where(merged.notna(), harmonized[source_col])
 
         if len(selected) == 1 and selected[0] != canonical:
             report["renamed"][selected[0]] = canonical
@@ -136,15 +173,10 @@ def harmonize_year_columns(
             )
 
         harmonized[canonical] = merged
-
         # Keep only canonical column for mapped aliases to preserve stable schema.
-        drop_candidates = [col for col in selected if col != canonical]
-        if drop_candidates:
-            harmonized = harmonized.drop(columns=drop_candidates, errors="ignore")
-            all_columns_ordered = [c for c in all_columns_ordered if c not in drop_candidates]
-            if canonical not in all_columns_ordered:
-                all_columns_ordered.append(canonical)
-        elif canonical not in all_columns_ordered:
-            all_columns_ordered.append(canonical)
+        drop_columns.extend(col for col in selected if col != canonical)
+
+    if drop_columns:
+        harmonized = harmonized.drop(columns=drop_columns, errors="ignore")
 
     return harmonized, report
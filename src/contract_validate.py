@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
+import numpy as np
 import pandas as pd
 
 from src.utils import get_logger
@@ -25,7 +32,14 @@ def load_year_contract(year: int, contracts_dir: str | Path = "docs/contracts")
             f"Contrato não encontrado para year={year}: '{path}'. "
             "Verifique docs/contracts e execute export dos contratos."
         )
-    return json.loads(path.read_text(encoding="utf-8"))
+    # Callers may mutate the contract, so hand out a copy of the cached parse.
+    return copy.deepcopy(_load_contract_file(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=64)
+def _load_contract_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    # mtime_ns is part of the cache key so a re-exported contract is read again.
+    return json.loads(Path(path).read_text(encoding="utf-8"))
 
 
 def _normalize_enforcement(value: Any) -> str:
@@ -43,6 +57,13 @@ def _normalize_presence(value: Any) -> str:
 
 
 def _normalize_dtype_name(dtype: Any) -> str:
+    # Observed dtypes are objects: branch on their type before building strings.
+    if isinstance(dtype, pd.StringDtype):
+        return "string"
+    if not isinstance(dtype, str) and pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime64[ns]"
+    if isinstance(dtype, (pd.Int64Dtype, pd.Float64Dtype)):
+        return dtype.name
     text = str(dtype).strip()
     low = text.lower()
     if low.startswith("string"):
@@ -54,6 +75,19 @@ def _normalize_dtype_name(dtype: Any) -> str:
     return text
 
 
+@lru_cache(maxsize=1024)
+def _compiled_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=128)
+def _resolve_dtype(name: str) -> Any | None:
+    try:
+        return pd.api.types.pandas_dtype(name)
+    except (TypeError, ValueError, ImportError):
+        return None
+
+
 def _rule_violation(
     *,
     year: int,
@@ -75,17 +109,59 @@ def _rule_violation(
     }
 
 
-def _domain_range_metrics(series: pd.Series, spec: dict[str, Any]) -> dict[str, Any]:
-    numeric = pd.to_numeric(series, errors="coerce")
-    non_null = int(series.notna().sum())
-    cast_invalid = int((series.notna() & numeric.isna()).sum())
+def _fast_null_count(series: pd.Series) -> int:
+    dtype = series.dtype
+    # NumPy integer and boolean columns cannot hold missing values.
+    if isinstance(dtype, np.dtype) and dtype.kind in "iub":
+        return 0
+    # Arrow-backed arrays keep the null count in their buffer metadata.
+    arrow_array = getattr(series.array, "_pa_array", None)
+    if arrow_array is not None:
+        return int(arrow_array.null_count)
+    return int(series.isna().sum())
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    return series.astype("string")
+
+
+def _is_text_categorical(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(
+        series.cat.categories
+    )
+
+
+def _count_out_of_bounds(values: np.ndarray, low: Any, high: Any) -> int:
+    if low is None and high is None:
+        return 0
+    if high is None:
+        return int(np.count_nonzero(values < low))
+    if low is None:
+        return int(np.count_nonzero(values > high))
+    out_mask = values < low
+    np.logical_or(out_mask, values > high, out=out_mask)
+    return int(np.count_nonzero(out_mask))
+
+
+def _domain_range_metrics(
+    series: pd.Series,
+    spec: dict[str, Any],
+    non_null: int,
+) -> dict[str, Any]:
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        # Already numeric: nothing can fail the cast, so skip coercion and the mask.
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        cast_invalid = 0
+    else:
+        values = pd.to_numeric(series, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        cast_invalid = int(np.count_nonzero(series.notna().to_numpy() & np.isnan(values)))
 
-    out_mask = pd.Series(False, index=series.index, dtype=bool)
-    if spec.get("min") is not None:
-        out_mask = out_mask | (numeric < spec["min"])
-    if spec.get("max") is not None:
-        out_mask = out_mask | (numeric > spec["max"])
-    out_of_range = int((numeric.notna() & out_mask).sum())
+    # NaN compares False against both bounds, so no extra notna pass is needed.
+    out_of_range = _count_out_of_bounds(values, spec.get("min"), spec.get("max"))
 
     invalid_total = cast_invalid + out_of_range
     invalid_rate = float(invalid_total / non_null) if non_null > 0 else 0.0
@@ -98,12 +174,19 @@ def _domain_range_metrics(series: pd.Series, spec: dict[str, Any]) -> dict[str,
     }
 
 
-def _domain_set_metrics(series: pd.Series, allowed: set[str]) -> dict[str, Any]:
-    as_text = series.astype("string")
-    non_null_mask = as_text.notna()
-    non_null = int(non_null_mask.sum())
-    invalid_mask = non_null_mask & ~as_text.isin(list(allowed))
-    not_allowed = int(invalid_mask.sum())
+def _domain_set_metrics(
+    values: pd.Series,
+    allowed: frozenset[str],
+    non_null: int,
+) -> dict[str, Any]:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Decide membership once per category; the trailing False serves the -1 (NA) code.
+        category_allowed = values.cat.categories.isin(list(allowed))
+        matched = np.append(category_allowed, False)[values.cat.codes.to_numpy()]
+    else:
+        matched = values.isin(list(allowed)).to_numpy()
+    # Nulls never match, so everything non-null that did not match is invalid.
+    not_allowed = non_null - int(np.count_nonzero(matched))
     invalid_rate = float(not_allowed / non_null) if non_null > 0 else 0.0
     return {
         "n_non_null": non_null,
@@ -112,12 +195,13 @@ def _domain_set_metrics(series: pd.Series, allowed: set[str]) -> dict[str, Any]:
     }
 
 
-def _domain_regex_metrics(series: pd.Series, pattern: str) -> dict[str, Any]:
-    as_text = series.astype("string")
-    non_null_mask = as_text.notna()
-    non_null = int(non_null_mask.sum())
-    invalid_mask = non_null_mask & ~as_text.str.fullmatch(pattern, na=False)
-    invalid = int(invalid_mask.sum())
+def _domain_regex_metrics(
+    as_text: pd.Series,
+    pattern: re.Pattern[str],
+    non_null: int,
+) -> dict[str, Any]:
+    matched = as_text.str.fullmatch(pattern, na=False).to_numpy(dtype=bool)
+    invalid = non_null - int(np.count_nonzero(matched))
     invalid_rate = float(invalid / non_null) if non_null > 0 else 0.0
     return {
         "n_non_null": non_null,
@@ -130,20 +214,25 @@ def _domain_date_range_metrics(
     series: pd.Series,
     start: str | None,
     end: str | None,
+    non_null: int,
+    date_format: str | None = None,
 ) -> dict[str, Any]:
-    parsed = pd.to_datetime(series, errors="coerce")
-    non_null_mask = series.notna()
-    non_null = int(non_null_mask.sum())
-    parse_invalid = int((non_null_mask & parsed.isna()).sum())
-
-    out_mask = pd.Series(False, index=series.index, dtype=bool)
-    if start is not None:
-        start_ts = pd.Timestamp(start)
-        out_mask = out_mask | (parsed < start_ts)
-    if end is not None:
-        end_ts = pd.Timestamp(end)
-        out_mask = out_mask | (parsed > end_ts)
-    out_of_range = int((parsed.notna() & out_mask).sum())
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        stamps = series.to_numpy()
+        parse_invalid = 0
+    else:
+        # An explicit format skips per-element inference; cache=True dedupes repeated strings.
+        stamps = pd.to_datetime(
+            series, format=date_format, errors="coerce", cache=True
+        ).to_numpy()
+        parse_invalid = int(np.count_nonzero(series.notna().to_numpy() & np.isnat(stamps)))
+
+    # NaT compares False against both bounds, so no extra notna pass is needed.
+    out_of_range = _count_out_of_bounds(
+        stamps,
+        pd.Timestamp(start).to_datetime64() if start is not None else None,
+        pd.Timestamp(end).to_datetime64() if end is not None else None,
+    )
 
     invalid_total = parse_invalid + out_of_range
     invalid_rate = float(invalid_total / non_null) if non_null > 0 else 0.0
@@ -156,223 +245,409 @@ def _domain_date_range_metrics(
     }
 
 
-def validate_frame_against_contract(
-    df: pd.DataFrame,
+@dataclass(frozen=True, slots=True)
+class RulePlan:
+    """One contract rule with enforcement, dtype, allowed set and regex pre-resolved."""
+
+    rule_type: str
+    kind: str
+    enforcement: str
+    spec: dict[str, Any]
+    expected_dtype: str | None = None
+    expected_dtype_obj: Any | None = None
+    allowed: frozenset[str] = frozenset()
+    pattern: re.Pattern[str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnPlan:
+    """Compiled rules for one contract column."""
+
+    name: str
+    rules: tuple[RulePlan, ...]
+    # dtype-only columns never look at null counts, so the scan can be skipped.
+    needs_null_count: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledContract:
+    """Contract normalized once so it can be validated against many dataframes."""
+
+    columns: dict[str, ColumnPlan]
+
+
+def _compile_rule(rule: dict[str, Any], optional: bool) -> RulePlan | None:
+    rule_type = str(rule.get("rule_type", "")).strip()
+    enforcement = _normalize_enforcement(rule.get("enforcement"))
+    spec = rule.get("spec", {}) or {}
+
+    if rule_type == "dtype":
+        expected = spec.get("expected_dtype") or spec.get("expected")
+        return RulePlan(
+            rule_type="dtype",
+            kind="",
+            enforcement=enforcement,
+            spec=spec,
+            expected_dtype=_normalize_dtype_name(expected),
+            expected_dtype_obj=_resolve_dtype(str(expected)) if expected else None,
+        )
+
+    # Missing and domain findings on structural_optional columns are informational.
+    if optional:
+        enforcement = "info"
+
+    if rule_type == "missing":
+        # A rule that allows missing values can never produce a finding.
+        if bool(spec.get("allow_missing", True)):
+            return None
+        return RulePlan(rule_type="missing", kind="", enforcement=enforcement, spec=spec)
+
+    if rule_type != "domain":
+        return None
+
+    kind = str(spec.get("kind", "none")).strip().lower()
+    if kind == "none":
+        return None
+    if kind == "regex":
+        pattern = str(spec.get("pattern") or "")
+        if pattern == "":
+            return None
+        # Fail-fast for malformed regex in contract configuration.
+        return RulePlan(
+            rule_type="domain",
+            kind=kind,
+            enforcement=enforcement,
+            spec=spec,
+            pattern=_compiled_pattern(pattern),
+        )
+    if kind == "set":
+        return RulePlan(
+            rule_type="domain",
+            kind=kind,
+            enforcement=enforcement,
+            spec=spec,
+            allowed=frozenset(str(item) for item in (spec.get("allowed") or [])),
+        )
+    return RulePlan(rule_type="domain", kind=kind, enforcement=enforcement, spec=spec)
+
+
+def compile_contract(contract: dict[str, Any]) -> CompiledContract:
+    """Normalize and precompile a loaded contract for repeated validation."""
+    columns: dict[str, ColumnPlan] = {}
+    for name, col_spec in contract.get("columns", {}).items():
+        optional = _normalize_presence(col_spec.get("presence")) == "structural_optional"
+        rules = (_compile_rule(rule, optional) for rule in col_spec.get("rules", []))
+        kept = tuple(rule for rule in rules if rule is not None)
+        columns[name] = ColumnPlan(
+            name=name,
+            rules=kept,
+            needs_null_count=any(rule.rule_type != "dtype" for rule in kept),
+        )
+    return CompiledContract(columns=columns)
+
+
+@dataclass
+class _ColumnContext:
+    year: int
+    column: str
+    series: pd.Series
+    null_count: int
+    non_null: int
+    # Built on the first set/regex rule that needs it and shared by the rest.
+    _as_text: pd.Series | None = None
+
+    def as_text(self) -> pd.Series:
+        if self._as_text is None:
+            self._as_text = _as_text(self.series)
+        return self._as_text
+
+
+_RuleHandler = Callable[[_ColumnContext, RulePlan], dict[str, Any] | None]
+
+
+def _check_dtype(
+    ctx: _ColumnContext,
+    rule: RulePlan,
+) -> dict[str, Any] | None:
+    # Equal dtype objects always normalize to the same name.
+    if rule.expected_dtype_obj is not None and ctx.series.dtype == rule.expected_dtype_obj:
+        return None
+    expected_norm = rule.expected_dtype
+    observed_norm = _normalize_dtype_name(ctx.series.dtype)
+    if expected_norm == observed_norm:
+        return None
+    return _rule_violation(
+        year=ctx.year,
+        column=ctx.column,
+        rule_type="dtype",
+        kind="dtype",
+        enforcement=rule.enforcement,
+        message=(
+            f"[year={ctx.year}] dtype inválido em '{ctx.column}': "
+            f"expected={expected_norm}, observed={observed_norm}."
+        ),
+        metrics={
+            "expected_dtype": expected_norm,
+            "observed_dtype": observed_norm,
+        },
+    )
+
+
+def _check_missing(
+    ctx: _ColumnContext,
+    rule: RulePlan,
+) -> dict[str, Any] | None:
+    allow_missing = bool(rule.spec.get("allow_missing", True))
+    missing_count = ctx.null_count
+    if allow_missing or missing_count == 0:
+        return None
+    missing_rate = float(missing_count / len(ctx.series)) if len(ctx.series) else 0.0
+    return _rule_violation(
+        year=ctx.year,
+        column=ctx.column,
+        rule_type="missing",
+        kind="missing",
+        enforcement=rule.enforcement,
+        message=(
+            f"[year={ctx.year}] missing não permitido em '{ctx.column}' "
+            f"(missing_rate={missing_rate:.2%})."
+        ),
+        metrics={
+            "allow_missing": allow_missing,
+            "missing_count": missing_count,
+            "missing_rate": round(missing_rate, 6),
+        },
+    )
+
+
+def _check_range(
+    ctx: _ColumnContext,
+    rule: RulePlan,
+) -> dict[str, Any] | None:
+    metrics = _domain_range_metrics(ctx.series, rule.spec, ctx.non_null)
+    if metrics["n_invalid"] == 0:
+        return None
+    return _rule_violation(
+        year=ctx.year,
+        column=ctx.column,
+        rule_type="domain",
+        kind="range",
+        enforcement=rule.enforcement,
+        message=(
+            f"[year={ctx.year}] domínio range inválido em '{ctx.column}' "
+            f"(n_invalid={metrics['n_invalid']})."
+        ),
+        metrics=metrics,
+    )
+
+
+def _check_set(
+    ctx: _ColumnContext,
+    rule: RulePlan,
+) -> dict[str, Any] | None:
+    values = ctx.series if _is_text_categorical(ctx.series) else ctx.as_text()
+    metrics = _domain_set_metrics(values, rule.allowed, ctx.non_null)
+    if metrics["n_not_allowed"] == 0:
+        return None
+    return _rule_violation(
+        year=ctx.year,
+        column=ctx.column,
+        rule_type="domain",
+        kind="set",
+        enforcement=rule.enforcement,
+        message=(
+            f"[year={ctx.year}] domínio set inválido em '{ctx.column}' "
+            f"(n_not_allowed={metrics['n_not_allowed']})."
+        ),
+        metrics=metrics,
+    )
+
+
+def _check_regex(
+    ctx: _ColumnContext,
+    rule: RulePlan,
+) -> dict[str, Any] | None:
+    if rule.pattern is None:
+        return None
+    metrics = _domain_regex_metrics(ctx.as_text(), rule.pattern, ctx.non_null)
+    if metrics["n_not_matching"] == 0:
+        return None
+    return _rule_violation(
+        year=ctx.year,
+        column=ctx.column,
+        rule_type="domain",
+        kind="regex",
+        enforcement=rule.enforcement,
+        message=(
+            f"[year={ctx.year}] domínio regex inválido em '{ctx.column}' "
+            f"(n_not_matching={metrics['n_not_matching']})."
+        ),
+        metrics=metrics,
+    )
+
+
+def _check_date_range(
+    ctx: _ColumnContext,
+    rule: RulePlan,
+) -> dict[str, Any] | None:
+    metrics = _domain_date_range_metrics(
+        ctx.series,
+        rule.spec.get("start"),
+        rule.spec.get("end"),
+        ctx.non_null,
+        date_format=rule.spec.get("format"),
+    )
+    if metrics["n_invalid"] == 0:
+        return None
+    return _rule_violation(
+        year=ctx.year,
+        column=ctx.column,
+        rule_type="domain",
+        kind="date_range",
+        enforcement=rule.enforcement,
+        message=(
+            f"[year={ctx.year}] domínio date_range inválido em '{ctx.column}' "
+            f"(n_invalid={metrics['n_invalid']})."
+        ),
+        metrics=metrics,
+    )
+
+
+# Keyed by (rule_type, kind); dtype and missing rules carry no kind.
+_RULE_HANDLERS: dict[tuple[str, str], _RuleHandler] = {
+    ("dtype", ""): _check_dtype,
+    ("missing", ""): _check_missing,
+    ("domain", "range"): _check_range,
+    ("domain", "set"): _check_set,
+    ("domain", "regex"): _check_regex,
+    ("domain", "date_range"): _check_date_range,
+}
+
+
+def _validate_column(
     year: int,
-    contract: dict[str, Any],
-) -> dict[str, Any]:
-    """Validate one dataframe against one yearly contract definition."""
-    contract_columns = set(contract.get("columns", {}).keys())
-    df_columns = set(df.columns)
+    plan: ColumnPlan,
+    series: pd.Series,
+    null_count: int,
+) -> list[dict[str, Any]]:
     findings: list[dict[str, Any]] = []
+    ctx = _ColumnContext(
+        year=year,
+        column=plan.name,
+        series=series,
+        null_count=null_count,
+        non_null=len(series) - null_count,
+    )
 
-    missing_cols = sorted(contract_columns - df_columns)
-    extra_cols = sorted(df_columns - contract_columns)
+    for rule in plan.rules:
+        handler = _RULE_HANDLERS.get((rule.rule_type, rule.kind))
+        if handler is not None:
+            finding = handler(ctx, rule)
+            if finding is not None:
+                findings.append(finding)
+            continue
 
-    for col in missing_cols:
         findings.append(
             _rule_violation(
                 year=year,
-                column=col,
-                rule_type="schema",
-                kind="missing_column",
-                enforcement="error",
+                column=plan.name,
+                rule_type="domain",
+                kind=rule.kind,
+                enforcement="info",
                 message=(
-                    f"[year={year}] coluna esperada ausente no DataFrame: '{col}'."
+                    f"[year={year}] kind de domínio desconhecido para '{plan.name}': "
+                    f"'{rule.kind}'."
                 ),
             )
         )
 
+    return findings
+
+
+def _iter_findings(
+    df: pd.DataFrame,
+    year: int,
+    columns: dict[str, ColumnPlan],
+    missing_cols: list[str],
+    extra_cols: list[str],
+    shared_columns: list[str],
+    max_workers: int | None,
+) -> Iterator[dict[str, Any]]:
+    for col in missing_cols:
+        yield _rule_violation(
+            year=year,
+            column=col,
+            rule_type="schema",
+            kind="missing_column",
+            enforcement="error",
+            message=(
+                f"[year={year}] coluna esperada ausente no DataFrame: '{col}'."
+            ),
+        )
+
     for col in extra_cols:
-        findings.append(
-            _rule_violation(
-                year=year,
-                column=col,
-                rule_type="schema",
-                kind="extra_column",
-                enforcement="warning",
-                message=f"[year={year}] coluna extra não prevista no contrato: '{col}'.",
-            )
+        yield _rule_violation(
+            year=year,
+            column=col,
+            rule_type="schema",
+            kind="extra_column",
+            enforcement="warning",
+            message=f"[year={year}] coluna extra não prevista no contrato: '{col}'.",
         )
 
-    shared_columns = sorted(contract_columns & df_columns)
-    contract_specs = contract.get("columns", {})
+    def _check(col: str) -> list[dict[str, Any]]:
+        plan = columns[col]
+        if not plan.rules:
+            return []
+        series = df[col]
+        null_count = _fast_null_count(series) if plan.needs_null_count else 0
+        return _validate_column(year, plan, series, null_count)
+
+    if max_workers is not None and max_workers > 1 and len(shared_columns) > 1:
+        workers = min(max_workers, len(shared_columns), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for items in executor.map(_check, shared_columns):
+                yield from items
+        return
 
     for col in shared_columns:
-        col_spec = contract_specs[col]
-        rules = col_spec.get("rules", [])
-        presence = _normalize_presence(col_spec.get("presence"))
-
-        for rule in rules:
-            rule_type = str(rule.get("rule_type", "")).strip()
-            enforcement = _normalize_enforcement(rule.get("enforcement"))
-            spec = rule.get("spec", {}) or {}
-            series = df[col]
-
-            if rule_type == "dtype":
-                expected = spec.get("expected_dtype") or spec.get("expected")
-                expected_norm = _normalize_dtype_name(expected)
-                observed = str(series.dtype)
-                observed_norm = _normalize_dtype_name(observed)
-                if expected_norm != observed_norm:
-                    findings.append(
-                        _rule_violation(
-                            year=year,
-                            column=col,
-                            rule_type="dtype",
-                            kind="dtype",
-                            enforcement=enforcement,
-                            message=(
-                                f"[year={year}] dtype inválido em '{col}': "
-                                f"expected={expected_norm}, observed={observed_norm}."
-                            ),
-                            metrics={
-                                "expected_dtype": expected_norm,
-                                "observed_dtype": observed_norm,
-                            },
-                        )
-                    )
-                continue
-
-            if rule_type == "missing":
-                allow_missing = bool(spec.get("allow_missing", True))
-                missing_count = int(series.isna().sum())
-                missing_rate = float(missing_count / len(series)) if len(series) else 0.0
-                if (not allow_missing) and missing_count > 0:
-                    effective_enforcement = (
-                        "info" if presence == "structural_optional" else enforcement
-                    )
-                    findings.append(
-                        _rule_violation(
-                            year=year,
-                            column=col,
-                            rule_type="missing",
-                            kind="missing",
-                            enforcement=effective_enforcement,
-                            message=(
-                                f"[year={year}] missing não permitido em '{col}' "
-                                f"(missing_rate={missing_rate:.2%})."
-                            ),
-                            metrics={
-                                "allow_missing": allow_missing,
-                                "missing_count": missing_count,
-                                "missing_rate": round(missing_rate, 6),
-                            },
-                        )
-                    )
-                continue
-
-            if rule_type != "domain":
-                continue
-
-            kind = str(spec.get("kind", "none")).strip().lower()
-            if kind == "none":
-                continue
-
-            effective_enforcement = "info" if presence == "structural_optional" else enforcement
-
-            if kind == "range":
-                metrics = _domain_range_metrics(series, spec)
-                if metrics["n_invalid"] > 0:
-                    findings.append(
-                        _rule_violation(
-                            year=year,
-                            column=col,
-                            rule_type="domain",
-                            kind="range",
-                            enforcement=effective_enforcement,
-                            message=(
-                                f"[year={year}] domínio range inválido em '{col}' "
-                                f"(n_invalid={metrics['n_invalid']})."
-                            ),
-                            metrics=metrics,
-                        )
-                    )
-                continue
-
-            if kind == "set":
-                allowed = {str(item) for item in (spec.get("allowed") or [])}
-                metrics = _domain_set_metrics(series, allowed)
-                if metrics["n_not_allowed"] > 0:
-                    findings.append(
-                        _rule_violation(
-                            year=year,
-                            column=col,
-                            rule_type="domain",
-                            kind="set",
-                            enforcement=effective_enforcement,
-                            message=(
-                                f"[year={year}] domínio set inválido em '{col}' "
-                                f"(n_not_allowed={metrics['n_not_allowed']})."
-                            ),
-                            metrics=metrics,
-                        )
-                    )
-                continue
-
-            if kind == "regex":
-                pattern = str(spec.get("pattern") or "")
-                if pattern == "":
-                    continue
-                # Fail-fast for malformed regex in contract configuration.
-                re.compile(pattern)
-                metrics = _domain_regex_metrics(series, pattern)
-                if metrics["n_not_matching"] > 0:
-                    findings.append(
-                        _rule_violation(
-                            year=year,
-                            column=col,
-                            rule_type="domain",
-                            kind="regex",
-                            enforcement=effective_enforcement,
-                            message=(
-                                f"[year={year}] domínio regex inválido em '{col}' "
-                                f"(n_not_matching={metrics['n_not_matching']})."
-                            ),
-                            metrics=metrics,
-                        )
-                    )
-                continue
-
-            if kind == "date_range":
-                metrics = _domain_date_range_metrics(
-                    series,
-                    spec.get("start"),
-                    spec.get("end"),
-                )
-                if metrics["n_invalid"] > 0:
-                    findings.append(
-                        _rule_violation(
-                            year=year,
-                            column=col,
-                            rule_type="domain",
-                            kind="date_range",
-                            enforcement=effective_enforcement,
-                            message=(
-                                f"[year={year}] domínio date_range inválido em '{col}' "
-                                f"(n_invalid={metrics['n_invalid']})."
-                            ),
-                            metrics=metrics,
-                        )
-                    )
-                continue
-
-            findings.append(
-                _rule_violation(
-                    year=year,
-                    column=col,
-                    rule_type="domain",
-                    kind=kind,
-                    enforcement="info",
-                    message=(
-                        f"[year={year}] kind de domínio desconhecido para '{col}': '{kind}'."
-                    ),
-                )
-            )
+        yield from _check(col)
 
-    errors_count = sum(item["enforcement"] == "error" for item in findings)
-    warnings_count = sum(item["enforcement"] == "warning" for item in findings)
-    infos_count = sum(item["enforcement"] == "info" for item in findings)
+
+def validate_frame_against_contract(
+    df: pd.DataFrame,
+    year: int,
+    contract: dict[str, Any] | CompiledContract,
+    max_workers: int | None = None,
+    sink: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Validate one dataframe against one yearly contract definition.
+
+    Columns are independent, so `max_workers > 1` checks them on a thread pool;
+    findings keep the sorted column order either way. When `sink` is given each
+    finding is handed to it as produced and the returned `findings` list stays empty.
+    Pass a `compile_contract` result to reuse one contract across many dataframes.
+    """
+    compiled = contract if isinstance(contract, CompiledContract) else compile_contract(contract)
+    contract_columns = set(compiled.columns)
+    df_columns = set(df.columns)
+
+    missing_cols = sorted(contract_columns - df_columns)
+    extra_cols = sorted(df_columns - contract_columns)
+    shared_columns = sorted(contract_columns & df_columns)
+
+    findings: list[dict[str, Any]] = []
+    emit = findings.append if sink is None else sink
+    enforcement_counts: Counter[str] = Counter()
+    for finding in _iter_findings(
+        df, year, compiled.columns, missing_cols, extra_cols, shared_columns, max_workers
+    ):
+        enforcement_counts[finding["enforcement"]] += 1
+        emit(finding)
+
+    errors_count = enforcement_counts["error"]
+    warnings_count = enforcement_counts["warning"]
+    infos_count = enforcement_counts["info"]
     status = "FAIL" if errors_count > 0 else "PASS"
 
     result = {
@@ -402,3 +677,25 @@ def validate_frame_against_contract(
         len(extra_cols),
     )
     return result
+
+
+def validate_frames_against_contracts(
+    frames: dict[int, pd.DataFrame],
+    contracts: dict[int, dict[str, Any] | CompiledContract],
+    max_workers: int | None = None,
+) -> dict[int, dict[str, Any]]:
+    """Validate several yearly dataframes against their contracts.
+
+    Years are independent, so `max_workers > 1` validates them on a thread pool.
+    """
+    years = sorted(year for year in frames if year in contracts)
+
+    def _validate(year: int) -> dict[str, Any]:
+        return validate_frame_against_contract(frames[year], year, contracts[year])
+
+    if max_workers is not None and max_workers > 1 and len(years) > 1:
+        workers = min(max_workers, len(years), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(years, executor.map(_validate, years)))
+
+    return {year: _validate(year) for year in years}
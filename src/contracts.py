@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import argparse
-import copy
+import io
 import json
-from dataclasses import asdict, dataclass, field, is_dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from src.utils import json_bytes
 
 
 class Presence(str, Enum):
@@ -27,7 +31,7 @@ class Enforcement(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainSpec:
     """Domain and plausibility constraints for a column."""
 
@@ -41,7 +45,7 @@ class DomainSpec:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnRule:
     """Single validation rule declaration for a column."""
 
@@ -51,7 +55,7 @@ class ColumnRule:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnSpec:
     """Column contract including type, presence and rules."""
 
@@ -59,7 +63,7 @@ class ColumnSpec:
     dtype: str
     presence: Presence
     pii: bool
-    rules: list[ColumnRule] = field(default_factory=list)
+    rules: tuple[ColumnRule, ...] = ()
     description: str | None = None
 
 
@@ -81,159 +85,165 @@ ROWS_EXPECTED_BY_YEAR: dict[int, int] = {
     2024: 1156,
 }
 
-ORIGINAL_COLUMNS_BY_YEAR: dict[int, set[str]] = {
-    2022: {
-        "Ano ingresso",
-        "Atingiu PV",
-        "Avaliador1",
-        "Avaliador2",
-        "Avaliador3",
-        "Avaliador4",
-        "Cf",
-        "Cg",
-        "Ct",
-        "Data_Nasc",
-        "Defasagem",
-        "Destaque IDA",
-        "Destaque IEG",
-        "Destaque IPV",
-        "Fase",
-        "Fase_Ideal",
-        "Gênero",
-        "IAA",
-        "IAN",
-        "IDA",
-        "IEG",
-        "INDE",
-        "INDE 22",
-        "IPS",
-        "IPV",
-        "Idade",
-        "Indicado",
-        "Ing",
-        "Instituição de ensino",
-        "Mat",
-        "Nome_Anon",
-        "Nº Av",
-        "Pedra 20",
-        "Pedra 21",
-        "Pedra 22",
-        "Pedra_Ano",
-        "Por",
-        "RA",
-        "Rec Av1",
-        "Rec Av2",
-        "Rec Av3",
-        "Rec Av4",
-        "Rec Psicologia",
-        "Turma",
-    },
-    2023: {
-        "Ano ingresso",
-        "Atingiu PV",
-        "Avaliador1",
-        "Avaliador2",
-        "Avaliador3",
-        "Avaliador4",
-        "Cf",
-        "Cg",
-        "Ct",
-        "Data_Nasc",
-        "Defasagem",
-        "Destaque IDA",
-        "Destaque IEG",
-        "Destaque IPV",
-        "Destaque IPV__dup1",
-        "Fase",
-        "Fase_Ideal",
-        "Gênero",
-        "IAA",
-        "IAN",
-        "IDA",
-        "IEG",
-        "INDE",
-        "INDE 2023",
-        "INDE 22",
-        "INDE 23",
-        "IPP",
-        "IPS",
-        "IPV",
-        "Idade",
-        "Indicado",
-        "Ing",
-        "Instituição de ensino",
-        "Mat",
-        "Nome_Anon",
-        "Nº Av",
-        "Pedra 20",
-        "Pedra 2023",
-        "Pedra 21",
-        "Pedra 22",
-        "Pedra 23",
-        "Pedra_Ano",
-        "Por",
-        "RA",
-        "Rec Av1",
-        "Rec Av2",
-        "Rec Av3",
-        "Rec Av4",
-        "Rec Psicologia",
-        "Turma",
-    },
-    2024: {
-        "Ano ingresso",
-        "Atingiu PV",
-        "Ativo/ Inativo",
-        "Ativo/ Inativo__dup1",
-        "Avaliador1",
-        "Avaliador2",
-        "Avaliador3",
-        "Avaliador4",
-        "Avaliador5",
-        "Avaliador6",
-        "Cf",
-        "Cg",
-        "Ct",
-        "Data_Nasc",
-        "Defasagem",
-        "Destaque IDA",
-        "Destaque IEG",
-        "Destaque IPV",
-        "Escola",
-        "Fase",
-        "Fase_Ideal",
-        "Gênero",
-        "IAA",
-        "IAN",
-        "IDA",
-        "IEG",
-        "INDE",
-        "INDE 2024",
-        "INDE 22",
-        "INDE 23",
-        "IPP",
-        "IPS",
-        "IPV",
-        "Idade",
-        "Indicado",
-        "Ing",
-        "Instituição de ensino",
-        "Mat",
-        "Nome_Anon",
-        "Nº Av",
-        "Pedra 20",
-        "Pedra 2024",
-        "Pedra 21",
-        "Pedra 22",
-        "Pedra 23",
-        "Pedra_Ano",
-        "Por",
-        "RA",
-        "Rec Av1",
-        "Rec Av2",
-        "Rec Psicologia",
-        "Turma",
-    },
+ORIGINAL_COLUMNS_BY_YEAR: dict[int, frozenset[str]] = {
+    2022: frozenset(
+        {
+            "Ano ingresso",
+            "Atingiu PV",
+            "Avaliador1",
+            "Avaliador2",
+            "Avaliador3",
+            "Avaliador4",
+            "Cf",
+            "Cg",
+            "Ct",
+            "Data_Nasc",
+            "Defasagem",
+            "Destaque IDA",
+            "Destaque IEG",
+            "Destaque IPV",
+            "Fase",
+            "Fase_Ideal",
+            "Gênero",
+            "IAA",
+            "IAN",
+            "IDA",
+            "IEG",
+            "INDE",
+            "INDE 22",
+            "IPS",
+            "IPV",
+            "Idade",
+            "Indicado",
+            "Ing",
+            "Instituição de ensino",
+            "Mat",
+            "Nome_Anon",
+            "Nº Av",
+            "Pedra 20",
+            "Pedra 21",
+            "Pedra 22",
+            "Pedra_Ano",
+            "Por",
+            "RA",
+            "Rec Av1",
+            "Rec Av2",
+            "Rec Av3",
+            "Rec Av4",
+            "Rec Psicologia",
+            "Turma",
+        }
+    ),
+    2023: frozenset(
+        {
+            "Ano ingresso",
+            "Atingiu PV",
+            "Avaliador1",
+            "Avaliador2",
+            "Avaliador3",
+            "Avaliador4",
+            "Cf",
+            "Cg",
+            "Ct",
+            "Data_Nasc",
+            "Defasagem",
+            "Destaque IDA",
+            "Destaque IEG",
+            "Destaque IPV",
+            "Destaque IPV__dup1",
+            "Fase",
+            "Fase_Ideal",
+            "Gênero",
+            "IAA",
+            "IAN",
+            "IDA",
+            "IEG",
+            "INDE",
+            "INDE 2023",
+            "INDE 22",
+            "INDE 23",
+            "IPP",
+            "IPS",
+            "IPV",
+            "Idade",
+            "Indicado",
+            "Ing",
+            "Instituição de ensino",
+            "Mat",
+            "Nome_Anon",
+            "Nº Av",
+            "Pedra 20",
+            "Pedra 2023",
+            "Pedra 21",
+            "Pedra 22",
+            "Pedra 23",
+            "Pedra_Ano",
+            "Por",
+            "RA",
+            "Rec Av1",
+            "Rec Av2",
+            "Rec Av3",
+            "Rec Av4",
+            "Rec Psicologia",
+            "Turma",
+        }
+    ),
+    2024: frozenset(
+        {
+            "Ano ingresso",
+            "Atingiu PV",
+            "Ativo/ Inativo",
+            "Ativo/ Inativo__dup1",
+            "Avaliador1",
+            "Avaliador2",
+            "Avaliador3",
+            "Avaliador4",
+            "Avaliador5",
+            "Avaliador6",
+            "Cf",
+            "Cg",
+            "Ct",
+            "Data_Nasc",
+            "Defasagem",
+            "Destaque IDA",
+            "Destaque IEG",
+            "Destaque IPV",
+            "Escola",
+            "Fase",
+            "Fase_Ideal",
+            "Gênero",
+            "IAA",
+            "IAN",
+            "IDA",
+            "IEG",
+            "INDE",
+            "INDE 2024",
+            "INDE 22",
+            "INDE 23",
+            "IPP",
+            "IPS",
+            "IPV",
+            "Idade",
+            "Indicado",
+            "Ing",
+            "Instituição de ensino",
+            "Mat",
+            "Nome_Anon",
+            "Nº Av",
+            "Pedra 20",
+            "Pedra 2024",
+            "Pedra 21",
+            "Pedra 22",
+            "Pedra 23",
+            "Pedra_Ano",
+            "Por",
+            "RA",
+            "Rec Av1",
+            "Rec Av2",
+            "Rec Psicologia",
+            "Turma",
+        }
+    ),
 }
 
 FINAL_DTYPES: dict[str, str] = {
@@ -296,61 +306,115 @@ FINAL_DTYPES: dict[str, str] = {
     "Turma": "string",
 }
 
-PII_COLUMNS: set[str] = {
-    "RA",
-    "Nome_Anon",
-    "Avaliador1",
-    "Avaliador2",
-    "Avaliador3",
-    "Avaliador4",
-    "Avaliador5",
-    "Avaliador6",
-}
+_SORTED_COLUMNS: tuple[str, ...] = tuple(sorted(FINAL_DTYPES))
 
-OPEN_DOMAIN_COLUMNS: set[str] = {
-    "Escola",
-    "Turma",
-    "Instituição de ensino",
-    "Fase",
-    "Fase_Ideal",
-}
+PII_COLUMNS: frozenset[str] = frozenset(
+    {
+        "RA",
+        "Nome_Anon",
+        "Avaliador1",
+        "Avaliador2",
+        "Avaliador3",
+        "Avaliador4",
+        "Avaliador5",
+        "Avaliador6",
+    }
+)
+
+OPEN_DOMAIN_COLUMNS: frozenset[str] = frozenset(
+    {
+        "Escola",
+        "Turma",
+        "Instituição de ensino",
+        "Fase",
+        "Fase_Ideal",
+    }
+)
+
+NUMERIC_RANGE_0_10_5: frozenset[str] = frozenset(
+    {
+        "INDE",
+        "IAA",
+        "IAN",
+        "IDA",
+        "IEG",
+        "IPS",
+        "IPP",
+        "IPV",
+        "Mat",
+        "Por",
+        "Ing",
+        "INDE 22",
+        "INDE 23",
+        "INDE 2023",
+        "INDE 2024",
+    }
+)
+
+PEDRA_COLUMNS: frozenset[str] = frozenset(
+    {
+        "Pedra_Ano",
+        "Pedra 20",
+        "Pedra 21",
+        "Pedra 22",
+        "Pedra 23",
+        "Pedra 2023",
+        "Pedra 2024",
+    }
+)
+
+
+_MISSING_REQUIRED_COLUMNS = frozenset({"RA", "Idade", "Defasagem", "Gênero", "Ano ingresso"})
+_MISSING_WARN_METRIC_COLUMNS = frozenset(
+    {"INDE", "IAA", "IAN", "IDA", "IEG", "IPS", "IPP", "IPV", "Mat", "Por"}
+)
+_CG_FAMILY_COLUMNS = frozenset({"Cg", "Cf", "Ct"})
+_INDICADO_PV_COLUMNS = frozenset({"Indicado", "Atingiu PV"})
+_ATIVO_COLUMNS = frozenset({"Ativo/ Inativo", "Ativo/ Inativo__dup1"})
+
+
+def _domain_spec(
+    kind: str = "none",
+    *,
+    min: float | int | None = None,
+    max: float | int | None = None,
+    allowed: list[str] | None = None,
+    pattern: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    notes: str | None = None,
+) -> dict[str, Any]:
+    """Return the dict form of a DomainSpec without building the dataclass."""
+    return {
+        "kind": kind,
+        "min": min,
+        "max": max,
+        "allowed": allowed,
+        "pattern": pattern,
+        "start": start,
+        "end": end,
+        "notes": notes,
+    }
 
-NUMERIC_RANGE_0_10_5: set[str] = {
-    "INDE",
-    "IAA",
-    "IAN",
-    "IDA",
-    "IEG",
-    "IPS",
-    "IPP",
-    "IPV",
-    "Mat",
-    "Por",
-    "Ing",
-    "INDE 22",
-    "INDE 23",
-    "INDE 2023",
-    "INDE 2024",
-}
 
-PEDRA_COLUMNS: set[str] = {
-    "Pedra_Ano",
-    "Pedra 20",
-    "Pedra 21",
-    "Pedra 22",
-    "Pedra 23",
-    "Pedra 2023",
-    "Pedra 2024",
+_PRESENCE_BY_YEAR_COLUMN: dict[tuple[int, str], Presence] = {
+    (year, column): (
+        Presence.ORIGINAL
+        if column in ORIGINAL_COLUMNS_BY_YEAR[year]
+        else Presence.STRUCTURAL_OPTIONAL
+    )
+    for year in SUPPORTED_YEARS
+    for column in FINAL_DTYPES
 }
 
 
 def _presence_for(year: int, column: str) -> Presence:
-    if column in ORIGINAL_COLUMNS_BY_YEAR[year]:
-        return Presence.ORIGINAL
-    return Presence.STRUCTURAL_OPTIONAL
+    return _PRESENCE_BY_YEAR_COLUMN[(year, column)]
 
 
+@cache
 def _dtype_rule(dtype: str) -> ColumnRule:
+    # One shared frozen rule per distinct dtype; FINAL_DTYPES only has a handful.
     return ColumnRule(
         rule_type="dtype",
         enforcement=Enforcement.ERROR,
@@ -358,97 +422,84 @@ def _dtype_rule(dtype: str) -> ColumnRule:
     )
 
 
-def _missing_rule(
-    *,
-    year: int,
-    column: str,
-    presence: Presence,
-) -> ColumnRule:
-    if presence == Presence.STRUCTURAL_OPTIONAL:
-        return ColumnRule(
-            rule_type="missing",
-            enforcement=Enforcement.INFO,
-            spec={"allow_missing": True},
-            notes="Coluna estrutural do alinhamento entre anos.",
-        )
+def _missing_required(year: int) -> ColumnRule:
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.ERROR,
+        spec={"allow_missing": False},
+    )
 
-    if column in {"RA", "Idade", "Defasagem", "Gênero", "Ano ingresso"}:
-        return ColumnRule(
-            rule_type="missing",
-            enforcement=Enforcement.ERROR,
-            spec={"allow_missing": False},
-        )
 
-    if column == "Data_Nasc":
-        return ColumnRule(
-            rule_type="missing",
-            enforcement=Enforcement.WARNING,
-            spec={"allow_missing": False},
-        )
+def _missing_data_nasc(year: int) -> ColumnRule:
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.WARNING,
+        spec={"allow_missing": False},
+    )
+
+
+def _missing_allowed_warning(year: int) -> ColumnRule:
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.WARNING,
+        spec={"allow_missing": True},
+    )
+
+
+def _missing_ing(year: int) -> ColumnRule:
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.INFO,
+        spec={"allow_missing": True},
+        notes="Missing historicamente alto nesta variável.",
+    )
+
 
-    if column in {"INDE", "IAA", "IAN", "IDA", "IEG", "IPS", "IPP", "IPV", "Mat", "Por"}:
+def _missing_nav(year: int) -> ColumnRule:
+    if year == 2023:
         return ColumnRule(
             rule_type="missing",
             enforcement=Enforcement.WARNING,
             spec={"allow_missing": True},
         )
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.ERROR,
+        spec={"allow_missing": False},
+    )
 
-    if column == "Ing":
-        return ColumnRule(
-            rule_type="missing",
-            enforcement=Enforcement.INFO,
-            spec={"allow_missing": True},
-            notes="Missing historicamente alto nesta variável.",
-        )
 
-    if column == "Nº Av":
-        if year == 2023:
-            return ColumnRule(
-                rule_type="missing",
-                enforcement=Enforcement.WARNING,
-                spec={"allow_missing": True},
-            )
+def _missing_cg_family(year: int) -> ColumnRule:
+    if year == 2022:
         return ColumnRule(
             rule_type="missing",
             enforcement=Enforcement.ERROR,
             spec={"allow_missing": False},
         )
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.INFO,
+        spec={"allow_missing": True},
+        notes="Variável estruturalmente ausente neste ano.",
+    )
 
-    if column in {"Cg", "Cf", "Ct"}:
-        if year == 2022:
-            return ColumnRule(
-                rule_type="missing",
-                enforcement=Enforcement.ERROR,
-                spec={"allow_missing": False},
-            )
-        return ColumnRule(
-            rule_type="missing",
-            enforcement=Enforcement.INFO,
-            spec={"allow_missing": True},
-            notes="Variável estruturalmente ausente neste ano.",
-        )
 
-    if column in {"Indicado", "Atingiu PV"}:
-        if year == 2022:
-            return ColumnRule(
-                rule_type="missing",
-                enforcement=Enforcement.ERROR,
-                spec={"allow_missing": False},
-            )
+def _missing_indicado_pv(year: int) -> ColumnRule:
+    if year == 2022:
         return ColumnRule(
             rule_type="missing",
-            enforcement=Enforcement.INFO,
-            spec={"allow_missing": True},
-            notes="Coluna presente mas sem preenchimento neste ano.",
+            enforcement=Enforcement.ERROR,
+            spec={"allow_missing": False},
         )
+    return ColumnRule(
+        rule_type="missing",
+        enforcement=Enforcement.INFO,
+        spec={"allow_missing": True},
+        notes="Coluna presente mas sem preenchimento neste ano.",
+    )
 
-    if column in OPEN_DOMAIN_COLUMNS or column in {"Ativo/ Inativo", "Ativo/ Inativo__dup1"}:
-        return ColumnRule(
-            rule_type="missing",
-            enforcement=Enforcement.WARNING,
-            spec={"allow_missing": True},
-        )
 
+def _missing_default(year: int) -> ColumnRule:
     return ColumnRule(
         rule_type="missing",
         enforcement=Enforcement.INFO,
@@ -456,156 +507,174 @@ def _missing_rule(
     )
 
 
-def _domain_rule(
+_MISSING_BUILDERS: dict[str, Callable[[int], ColumnRule]] = {
+    **dict.fromkeys(_MISSING_REQUIRED_COLUMNS, _missing_required),
+    "Data_Nasc": _missing_data_nasc,
+    **dict.fromkeys(_MISSING_WARN_METRIC_COLUMNS, _missing_allowed_warning),
+    "Ing": _missing_ing,
+    "Nº Av": _missing_nav,
+    **dict.fromkeys(_CG_FAMILY_COLUMNS, _missing_cg_family),
+    **dict.fromkeys(_INDICADO_PV_COLUMNS, _missing_indicado_pv),
+    **dict.fromkeys(OPEN_DOMAIN_COLUMNS | _ATIVO_COLUMNS, _missing_allowed_warning),
+}
+
+
+def _missing_rule(
     *,
     year: int,
     column: str,
     presence: Presence,
 ) -> ColumnRule:
-    if column == "Data_Nasc":
-        domain = DomainSpec(
-            kind="date_range",
-            start="1990-01-01",
-            end="2030-12-31",
-            notes="Faixa plausível para data de nascimento após padronização.",
-        )
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.WARNING,
-            spec=asdict(domain),
-        )
-
-    if column == "Idade":
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.ERROR,
-            spec=asdict(DomainSpec(kind="range", min=3, max=30)),
-        )
-
-    if column == "Defasagem":
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.ERROR,
-            spec=asdict(DomainSpec(kind="range", min=-10, max=10)),
-        )
-
-    if column in NUMERIC_RANGE_0_10_5:
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.ERROR,
-            spec=asdict(DomainSpec(kind="range", min=0, max=10.5)),
-        )
-
-    if column == "Nº Av":
+    if presence == Presence.STRUCTURAL_OPTIONAL:
         return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.ERROR,
-            spec=asdict(DomainSpec(kind="range", min=0, max=10)),
+            rule_type="missing",
+            enforcement=Enforcement.INFO,
+            spec={"allow_missing": True},
+            notes="Coluna estrutural do alinhamento entre anos.",
         )
+    return _MISSING_BUILDERS.get(column, _missing_default)(year)
 
-    if column == "Ano ingresso":
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.ERROR,
-            spec=asdict(DomainSpec(kind="range", min=2010, max=2030)),
-        )
 
-    if column == "Cg":
-        enforcement = Enforcement.WARNING if year == 2022 else Enforcement.INFO
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=enforcement,
-            spec=asdict(DomainSpec(kind="range", min=0, max=1000)),
-            notes="Semântica muda por ano; ajustar com evidência de negócio.",
-        )
+def _range_rule(
+    minimum: float | int,
+    maximum: float | int,
+    enforcement: Enforcement = Enforcement.ERROR,
+    notes: str | None = None,
+) -> ColumnRule:
+    return ColumnRule(
+        rule_type="domain",
+        enforcement=enforcement,
+        spec=_domain_spec(kind="range", min=minimum, max=maximum),
+        notes=notes,
+    )
 
-    if column == "Cf":
-        enforcement = Enforcement.WARNING if year == 2022 else Enforcement.INFO
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=enforcement,
-            spec=asdict(DomainSpec(kind="range", min=0, max=300)),
-            notes="Semântica muda por ano; ajustar com evidência de negócio.",
-        )
 
-    if column == "Ct":
-        enforcement = Enforcement.WARNING if year == 2022 else Enforcement.INFO
-        return ColumnRule(
-            rule_type="domain",
+# Year-invariant domain rules are built once and shared by every column and year using them.
+_RULE_DATA_NASC = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.WARNING,
+    spec=_domain_spec(
+        kind="date_range",
+        start="1990-01-01",
+        end="2030-12-31",
+        notes="Faixa plausível para data de nascimento após padronização.",
+    ),
+)
+_RULE_IDADE = _range_rule(3, 30)
+_RULE_DEFASAGEM = _range_rule(-10, 10)
+_RULE_SCORE_0_10_5 = _range_rule(0, 10.5)
+_RULE_NAV = _range_rule(0, 10)
+_RULE_ANO_INGRESSO = _range_rule(2010, 2030)
+_RULE_GENERO = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.ERROR,
+    spec=_domain_spec(kind="set", allowed=["Feminino", "Masculino"]),
+)
+_RULE_PEDRA = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.WARNING,
+    spec=_domain_spec(
+        kind="set",
+        allowed=["Ametista", "Ágata", "Quartzo", "Topázio"],
+        notes="Missing permitido; tokens inválidos devem virar NA.",
+    ),
+)
+_RULE_SIM_NAO = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.WARNING,
+    spec=_domain_spec(kind="set", allowed=["Sim", "Não"]),
+)
+_RULE_ATIVO_CURSANDO = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.WARNING,
+    spec=_domain_spec(kind="set", allowed=["Cursando"]),
+)
+_RULE_OPEN_DOMAIN = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.INFO,
+    spec=_domain_spec(
+        kind="none",
+        notes="Domínio aberto/alta cardinalidade; sem enumeração estrita.",
+    ),
+)
+_RULE_RA = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.INFO,
+    spec=_domain_spec(kind="none", notes="Identificador operacional; não usar como feature."),
+)
+_RULE_STRUCTURAL_OPTIONAL = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.INFO,
+    spec=_domain_spec(kind="none", notes="Coluna estrutural opcional no ano."),
+)
+_RULE_DOMAIN_NONE = ColumnRule(
+    rule_type="domain",
+    enforcement=Enforcement.INFO,
+    spec=_domain_spec(kind="none"),
+)
+
+
+def _yearly_semantics_range(maximum: int) -> Callable[[int, Presence], ColumnRule]:
+    by_enforcement = {
+        enforcement: _range_rule(
+            0,
+            maximum,
             enforcement=enforcement,
-            spec=asdict(DomainSpec(kind="range", min=0, max=50)),
             notes="Semântica muda por ano; ajustar com evidência de negócio.",
         )
+        for enforcement in (Enforcement.WARNING, Enforcement.INFO)
+    }
 
-    if column == "Gênero":
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.ERROR,
-            spec=asdict(DomainSpec(kind="set", allowed=["Feminino", "Masculino"])),
-        )
+    def build(year: int, presence: Presence) -> ColumnRule:
+        return by_enforcement[Enforcement.WARNING if year == 2022 else Enforcement.INFO]
 
-    if column in PEDRA_COLUMNS:
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.WARNING,
-            spec=asdict(
-                DomainSpec(
-                    kind="set",
-                    allowed=["Ametista", "Ágata", "Quartzo", "Topázio"],
-                    notes="Missing permitido; tokens inválidos devem virar NA.",
-                )
-            ),
-        )
+    return build
 
-    if column in {"Indicado", "Atingiu PV"}:
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.WARNING,
-            spec=asdict(DomainSpec(kind="set", allowed=["Sim", "Não"])),
-        )
 
-    if column == "Ativo/ Inativo" and year == 2024 and presence == Presence.ORIGINAL:
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.WARNING,
-            spec=asdict(DomainSpec(kind="set", allowed=["Cursando"])),
-        )
+def _domain_ativo_inativo(year: int, presence: Presence) -> ColumnRule:
+    if year == 2024 and presence == Presence.ORIGINAL:
+        return _RULE_ATIVO_CURSANDO
+    return _domain_default(year, presence)
 
-    if column in OPEN_DOMAIN_COLUMNS:
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.INFO,
-            spec=asdict(
-                DomainSpec(
-                    kind="none",
-                    notes="Domínio aberto/alta cardinalidade; sem enumeração estrita.",
-                )
-            ),
-        )
-
-    if column == "RA":
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.INFO,
-            spec=asdict(
-                DomainSpec(kind="none", notes="Identificador operacional; não usar como feature.")
-            ),
-        )
 
+def _domain_default(year: int, presence: Presence) -> ColumnRule:
     if presence == Presence.STRUCTURAL_OPTIONAL:
-        return ColumnRule(
-            rule_type="domain",
-            enforcement=Enforcement.INFO,
-            spec=asdict(DomainSpec(kind="none", notes="Coluna estrutural opcional no ano.")),
-        )
+        return _RULE_STRUCTURAL_OPTIONAL
+    return _RULE_DOMAIN_NONE
+
+
+_DOMAIN_BUILDERS: dict[str, ColumnRule | Callable[[int, Presence], ColumnRule]] = {
+    "Data_Nasc": _RULE_DATA_NASC,
+    "Idade": _RULE_IDADE,
+    "Defasagem": _RULE_DEFASAGEM,
+    **dict.fromkeys(NUMERIC_RANGE_0_10_5, _RULE_SCORE_0_10_5),
+    "Nº Av": _RULE_NAV,
+    "Ano ingresso": _RULE_ANO_INGRESSO,
+    "Cg": _yearly_semantics_range(1000),
+    "Cf": _yearly_semantics_range(300),
+    "Ct": _yearly_semantics_range(50),
+    "Gênero": _RULE_GENERO,
+    **dict.fromkeys(PEDRA_COLUMNS, _RULE_PEDRA),
+    **dict.fromkeys(_INDICADO_PV_COLUMNS, _RULE_SIM_NAO),
+    "Ativo/ Inativo": _domain_ativo_inativo,
+    **dict.fromkeys(OPEN_DOMAIN_COLUMNS, _RULE_OPEN_DOMAIN),
+    "RA": _RULE_RA,
+}
 
-    return ColumnRule(
-        rule_type="domain",
-        enforcement=Enforcement.INFO,
-        spec=asdict(DomainSpec(kind="none")),
-    )
+
+def _domain_rule(
+    *,
+    year: int,
+    column: str,
+    presence: Presence,
+) -> ColumnRule:
+    entry = _DOMAIN_BUILDERS.get(column, _domain_default)
+    if isinstance(entry, ColumnRule):
+        return entry
+    return entry(year, presence)
 
 
+@cache
 def _description_for(column: str) -> str | None:
     if column == "RA":
         return "Identificador do estudante (somente chave/auditoria)."
@@ -618,14 +687,15 @@ def _description_for(column: str) -> str | None:
     return None
 
 
+@cache
 def _build_column_spec(year: int, column: str) -> ColumnSpec:
     dtype = FINAL_DTYPES[column]
     presence = _presence_for(year, column)
-    rules = [
+    rules = (
         _dtype_rule(dtype),
         _missing_rule(year=year, column=column, presence=presence),
         _domain_rule(year=year, column=column, presence=presence),
-    ]
+    )
     return ColumnSpec(
         name=column,
         dtype=dtype,
@@ -636,67 +706,188 @@ def _build_column_spec(year: int, column: str) -> ColumnSpec:
     )
 
 
+# Key order here is the key order of the exported metadata block.
+_METADATA_TEMPLATE: dict[str, Any] = {
+    "contract_version": CONTRACT_VERSION,
+    "rows_expected": None,
+    "dataset_basename": None,
+    "dataset_sha256": None,
+    "generated_at": None,
+    "notes": (
+        "Presence diferencia colunas originais do ano e colunas estruturais do alinhamento."
+    ),
+}
+
+
 def _build_year_contract(year: int) -> YearContract:
     columns = {
-        column: _build_column_spec(year, column) for column in sorted(FINAL_DTYPES)
-    }
-    metadata = {
-        "contract_version": CONTRACT_VERSION,
-        "rows_expected": ROWS_EXPECTED_BY_YEAR[year],
-        "dataset_basename": None,
-        "dataset_sha256": None,
-        "generated_at": None,
-        "notes": (
-            "Presence diferencia colunas originais do ano e colunas estruturais do alinhamento."
-        ),
+        column: _build_column_spec(year, column) for column in _SORTED_COLUMNS
     }
+    metadata = _METADATA_TEMPLATE | {"rows_expected": ROWS_EXPECTED_BY_YEAR[year]}
     return YearContract(year=year, columns=columns, metadata=metadata)
 
 
+@cache
+def _year_contract(year: int) -> YearContract:
+    # Built on first use so importing the module (e.g. for PII_COLUMNS) stays cheap.
+    return _build_year_contract(year)
+
+
 def _build_contracts() -> dict[int, YearContract]:
-    return {year: _build_year_contract(year) for year in SUPPORTED_YEARS}
+    return {year: _year_contract(year) for year in SUPPORTED_YEARS}
 
 
-CONTRACTS_BY_YEAR: dict[int, YearContract] = _build_contracts()
+def __getattr__(name: str) -> Any:
+    # CONTRACTS_BY_YEAR is kept as a lazily built module attribute for existing callers.
+    if name == "CONTRACTS_BY_YEAR":
+        return _build_contracts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_year_contract(year: int) -> YearContract:
-    """Return a deep copy of the year contract."""
-    if year not in CONTRACTS_BY_YEAR:
+    """Return an independent copy of the year contract."""
+    if year not in SUPPORTED_YEARS:
         raise ValueError(f"Ano inválido: {year}. Anos suportados: {list(SUPPORTED_YEARS)}")
-    return copy.deepcopy(CONTRACTS_BY_YEAR[year])
+    return _contract_from_snapshot(_contract_snapshot(year))
+
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(item.name for item in fields(cls))
 
 
 def _to_jsonable(value: Any) -> Any:
+    # Exact-type dispatch for the common containers; enums and dataclasses fall through.
+    # Scalar children are copied inline, so only nested containers cost a Python call.
+    value_type = type(value)
+    if value_type is dict:
+        return {
+            str(key): val if type(val) in _SCALAR_TYPES else _to_jsonable(val)
+            for key, val in value.items()
+        }
+    if value_type is list or value_type is tuple:
+        return [item if type(item) in _SCALAR_TYPES else _to_jsonable(item) for item in value]
+    if value_type in _SCALAR_TYPES:
+        return value
     if isinstance(value, Enum):
         return value.value
     if is_dataclass(value):
-        return _to_jsonable(asdict(value))
+        # Walk fields directly; asdict would deep-copy every nested value first.
+        result = {}
+        for name in _field_names(value_type):
+            val = getattr(value, name)
+            result[name] = val if type(val) in _SCALAR_TYPES else _to_jsonable(val)
+        return result
     if isinstance(value, dict):
         return {str(key): _to_jsonable(val) for key, val in value.items()}
-    if isinstance(value, list):
+    if isinstance(value, (list, tuple)):
         return [_to_jsonable(item) for item in value]
     return value
 
 
+def _copy_spec(spec: dict[str, Any]) -> dict[str, Any]:
+    # Spec values are scalars or lists of strings, so a one-level copy is a full copy.
+    return {key: list(val) if isinstance(val, list) else val for key, val in spec.items()}
+
+
+def _contract_from_snapshot(snapshot: dict[str, Any]) -> YearContract:
+    columns = {
+        name: ColumnSpec(
+            name=column["name"],
+            dtype=column["dtype"],
+            presence=Presence(column["presence"]),
+            pii=column["pii"],
+            rules=tuple(
+                ColumnRule(
+                    rule_type=rule["rule_type"],
+                    enforcement=Enforcement(rule["enforcement"]),
+                    spec=_copy_spec(rule["spec"]),
+                    notes=rule["notes"],
+                )
+                for rule in column["rules"]
+            ),
+            description=column["description"],
+        )
+        for name, column in snapshot["columns"].items()
+    }
+    return YearContract(year=snapshot["year"], columns=columns, metadata=dict(snapshot["metadata"]))
+
+
+@cache
+def _contract_snapshot(year: int) -> dict[str, Any]:
+    # Plain dict/list form of the static contract, built on first use and never mutated.
+    return _to_jsonable(_year_contract(year))
+
+
 def _build_markdown(contract: YearContract) -> str:
-    lines: list[str] = []
-    lines.append(f"# Data Contract {contract.year}")
-    lines.append("")
-    lines.append("| Coluna | DType | Presence | PII | Regras |")
-    lines.append("|---|---|---|---|---|")
-
-    for column in sorted(contract.columns):
-        spec = contract.columns[column]
+    buffer = io.StringIO()
+    write = buffer.write
+    write(f"# Data Contract {contract.year}\n\n")
+    write("| Coluna | DType | Presence | PII | Regras |\n")
+    write("|---|---|---|---|---|\n")
+
+    # Contracts are built in _SORTED_COLUMNS order, so no re-sort is needed here.
+    for column, spec in contract.columns.items():
         rules = ", ".join(
             f"{rule.rule_type}:{rule.enforcement.value}" for rule in spec.rules
         )
         pii = "yes" if spec.pii else "no"
-        lines.append(
-            f"| {column} | {spec.dtype} | {spec.presence.value} | {pii} | {rules} |"
-        )
+        write(f"| {column} | {spec.dtype} | {spec.presence.value} | {pii} | {rules} |\n")
+
+    return buffer.getvalue()
+
+
+def _write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """Write data unless the file already holds exactly the same bytes."""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _write_json_if_changed(path: Path, payload: dict[str, Any]) -> bool:
+    """Write a contract payload unless only metadata.generated_at would change."""
+    try:
+        existing = path.read_bytes()
+        previous_ts = json.loads(existing)["metadata"]["generated_at"]
+    except (OSError, ValueError, KeyError, TypeError):
+        existing = None
+    if existing is not None:
+        metadata = payload["metadata"] | {"generated_at": previous_ts}
+        if json_bytes(payload | {"metadata": metadata}) == existing:
+            return False
+    path.write_bytes(json_bytes(payload))
+    return True
+
+
+def _export_year(
+    output_path: Path,
+    year: int,
+    metadata_updates: dict[str, Any],
+    write_markdown: bool,
+) -> None:
+    # Columns are static, so the cached snapshot is reused and only metadata is rebuilt.
+    metadata = _METADATA_TEMPLATE | {
+        "rows_expected": ROWS_EXPECTED_BY_YEAR[year],
+        **metadata_updates,
+    }
+    json_payload = {
+        "year": year,
+        "columns": _contract_snapshot(year)["columns"],
+        "metadata": metadata,
+    }
+    json_file = output_path / f"data_contract_{year}.json"
+    _write_json_if_changed(json_file, json_payload)
 
-    return "\n".join(lines).strip() + "\n"
+    if write_markdown:
+        md_file = output_path / f"data_contract_{year}.md"
+        _write_bytes_if_changed(md_file, _build_markdown(_year_contract(year)).encode("utf-8"))
 
 
 def export_contracts(
@@ -704,28 +895,33 @@ def export_contracts(
     dataset_basename: str | None = None,
     dataset_sha256: str | None = None,
     write_markdown: bool = True,
+    max_workers: int | None = None,
 ) -> None:
-    """Export yearly data contracts into versioned JSON files."""
+    """Export yearly data contracts into versioned JSON files.
+
+    Years are written independently, so `max_workers > 1` overlaps them on a thread pool.
+    """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    generated_at = datetime.now(timezone.utc).isoformat()
+    metadata_updates = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "dataset_basename": dataset_basename,
+        "dataset_sha256": dataset_sha256,
+    }
 
-    for year in SUPPORTED_YEARS:
-        contract = get_year_contract(year)
-        contract.metadata["generated_at"] = generated_at
-        contract.metadata["dataset_basename"] = dataset_basename
-        contract.metadata["dataset_sha256"] = dataset_sha256
-
-        json_payload = _to_jsonable(contract)
-        json_file = output_path / f"data_contract_{year}.json"
-        json_file.write_text(
-            json.dumps(json_payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+    if max_workers is not None and max_workers > 1:
+        workers = min(max_workers, len(SUPPORTED_YEARS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_export_year, output_path, year, metadata_updates, write_markdown)
+                for year in SUPPORTED_YEARS
+            ]
+            for future in futures:
+                future.result()
+        return
 
-        if write_markdown:
-            md_file = output_path / f"data_contract_{year}.md"
-            md_file.write_text(_build_markdown(contract), encoding="utf-8")
+    for year in SUPPORTED_YEARS:
+        _export_year(output_path, year, metadata_updates, write_markdown)
 
 
 def _parse_args() -> argparse.Namespace:
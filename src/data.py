@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import copy
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
 
+import numpy as np
 import pandas as pd
 from src.categories import (
     normalize_categories_all,
@@ -26,8 +29,18 @@ from src.schema import (
 )
 from src.utils import get_logger
 
+try:
+    import python_calamine
+except ImportError:  # pragma: no cover - optional speedup, openpyxl is the fallback
+    python_calamine = None
+
 _logger = get_logger(__name__)
 _DEFAS_SUFFIX_RE = re.compile(r"\.\d+$")
+_OPENPYXL_READ_KWARGS: dict[str, bool] = {
+    "read_only": True,
+    "data_only": True,
+    "keep_links": False,
+}
 
 YEAR_TO_SHEET: dict[int, str] = {
     2022: "PEDE2022",
@@ -40,6 +53,25 @@ _DEFAULT_DATASET_RELATIVE_PATH = Path(
 )
 
 
+_report_writer: ThreadPoolExecutor | None = None
+_pending_report_writes: list[Future] = []
+
+
+def _submit_report_write(write: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+    global _report_writer
+    if _report_writer is None:
+        _report_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+    future = _report_writer.submit(write, *args, **kwargs)
+    _pending_report_writes.append(future)
+    return future
+
+
+def wait_for_report_writes() -> None:
+    """Block until background report writes finish, re-raising the first failure."""
+    while _pending_report_writes:
+        _pending_report_writes.pop(0).result()
+
+
 def _ensure_dataset_exists(path: str | Path) -> Path:
     resolved = Path(path)
     if not resolved.exists():
@@ -65,15 +97,75 @@ def get_default_dataset_path() -> Path:
     return _ensure_dataset_exists(candidate)
 
 
+def _excel_engine() -> str:
+    # calamine (Rust reader, pandas >= 2.2) parses XLSX far faster than pure-Python openpyxl.
+    return "calamine" if python_calamine is not None else "openpyxl"
+
+
+def _open_workbook(path: Path) -> pd.ExcelFile:
+    engine = _excel_engine()
+    if engine == "openpyxl":
+        # Stream cell values only: no style/formula parsing, no external link resolution.
+        return pd.ExcelFile(path, engine=engine, engine_kwargs=_OPENPYXL_READ_KWARGS)
+    return pd.ExcelFile(path, engine=engine)
+
+
+def _sheet_cache_path(
+    path: Path,
+    sheet_name: str,
+    read_excel_kwargs: Mapping[str, object] | None,
+) -> Path | None:
+    # Keyed by mtime and size so an edited workbook never serves a stale sheet.
+    cache_dir = os.getenv("DATASET_CACHE_DIR")
+    if not cache_dir or read_excel_kwargs:
+        return None
+    stat = path.stat()
+    return Path(cache_dir) / f"{path.stem}-{sheet_name}-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+
+
+def _read_sheet_cache(
+    path: Path,
+    year: int,
+    sheet_name: str,
+    read_excel_kwargs: Mapping[str, object] | None,
+) -> pd.DataFrame | None:
+    cache_path = _sheet_cache_path(path, sheet_name, read_excel_kwargs)
+    if cache_path is None or not cache_path.exists():
+        return None
+    df = pd.read_pickle(cache_path)
+    _logger.info(
+        "Loaded cached XLSX sheet | file=%s year=%d sheet=%s rows=%d cols=%d",
+        path.name,
+        year,
+        sheet_name,
+        df.shape[0],
+        df.shape[1],
+    )
+    return df
+
+
 def _load_sheet_from_workbook(
     path: str | Path,
     year: int,
     sheet_name: str,
     *,
     read_excel_kwargs: Mapping[str, object] | None = None,
+    excel_file: pd.ExcelFile | None = None,
 ) -> pd.DataFrame:
     path_obj = _ensure_dataset_exists(path)
-    excel_file = pd.ExcelFile(path_obj, engine="openpyxl")
+    if excel_file is None:
+        cached = _read_sheet_cache(path_obj, year, sheet_name, read_excel_kwargs)
+        if cached is not None:
+            return cached
+        with _open_workbook(path_obj) as opened:
+            return _load_sheet_from_workbook(
+                path_obj,
+                year,
+                sheet_name,
+                read_excel_kwargs=read_excel_kwargs,
+                excel_file=opened,
+            )
+
     available_sheets = excel_file.sheet_names
     if sheet_name not in available_sheets:
         raise ValueError(
@@ -83,6 +175,10 @@ def _load_sheet_from_workbook(
 
     parse_kwargs = dict(read_excel_kwargs or {})
     df = excel_file.parse(sheet_name=sheet_name, **parse_kwargs)
+    cache_path = _sheet_cache_path(path_obj, sheet_name, read_excel_kwargs)
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache_path)
     _logger.info(
         "Loaded XLSX sheet | file=%s year=%d sheet=%s rows=%d cols=%d",
         path_obj.name,
@@ -94,6 +190,51 @@ def _load_sheet_from_workbook(
     return df
 
 
+def _load_sheets(
+    path: Path,
+    sheets_by_year: Mapping[int, str],
+    read_excel_kwargs: Mapping[str, object] | None = None,
+    max_workers: int | None = None,
+) -> dict[int, pd.DataFrame]:
+    datasets: dict[int, pd.DataFrame] = {}
+    pending: dict[int, str] = {}
+    for year, sheet_name in sheets_by_year.items():
+        cached = _read_sheet_cache(path, year, sheet_name, read_excel_kwargs)
+        if cached is None:
+            pending[year] = sheet_name
+        else:
+            datasets[year] = cached
+
+    if max_workers is not None and max_workers > 1 and len(pending) > 1:
+        # Workbook handles are not thread-safe, so each worker opens its own.
+        workers = min(max_workers, len(pending), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                year: executor.submit(
+                    _load_sheet_from_workbook,
+                    path,
+                    year,
+                    sheet_name,
+                    read_excel_kwargs=read_excel_kwargs,
+                )
+                for year, sheet_name in pending.items()
+            }
+            for year, future in futures.items():
+                datasets[year] = future.result()
+    elif pending:
+        # One workbook handle for every sheet: the XLSX archive is unzipped and parsed once.
+        with _open_workbook(path) as excel_file:
+            for year, sheet_name in pending.items():
+                datasets[year] = _load_sheet_from_workbook(
+                    path,
+                    year,
+                    sheet_name,
+                    read_excel_kwargs=read_excel_kwargs,
+                    excel_file=excel_file,
+                )
+    return {year: datasets[year] for year in sheets_by_year}
+
+
 def load_year_sheet_raw(path: str | Path, year: int) -> pd.DataFrame:
     """Read raw year sheet from XLSX without any schema standardization."""
     _validate_year(year)
@@ -101,13 +242,17 @@ def load_year_sheet_raw(path: str | Path, year: int) -> pd.DataFrame:
     return _load_sheet_from_workbook(path, year, sheet_name)
 
 
-def load_pede_workbook_raw(path: str | Path) -> dict[int, pd.DataFrame]:
-    """Read raw PEDE sheets (2022/2023/2024) without transformations."""
+def load_pede_workbook_raw(
+    path: str | Path,
+    max_workers: int | None = None,
+) -> dict[int, pd.DataFrame]:
+    """Read raw PEDE sheets (2022/2023/2024) without transformations.
+
+    Sheets are independent, so `max_workers > 1` parses them on a thread pool.
+    """
     path_obj = _ensure_dataset_exists(path)
-    datasets: dict[int, pd.DataFrame] = {}
-    for year in sorted(YEAR_TO_SHEET):
-        datasets[year] = load_year_sheet_raw(path_obj, year)
-    return datasets
+    sheets_by_year = {year: YEAR_TO_SHEET[year] for year in sorted(YEAR_TO_SHEET)}
+    return _load_sheets(path_obj, sheets_by_year, max_workers=max_workers)
 
 
 def standardize_columns(df: pd.DataFrame, year: int) -> pd.DataFrame:
@@ -117,13 +262,10 @@ def standardize_columns(df: pd.DataFrame, year: int) -> pd.DataFrame:
     """
     normalized = normalize_headers(df)
 
-    candidates: list[tuple[int, str]] = []
-    for idx, col in enumerate(normalized.columns):
-        base_name = _DEFAS_SUFFIX_RE.sub("", str(col).strip()).lower()
-        if base_name in {"defas", "defasagem"}:
-            candidates.append((idx, base_name))
-
-    if not candidates:
+    base_names = (
+        normalized.columns.astype(str).str.strip().str.replace(_DEFAS_SUFFIX_RE, "", regex=True)
+    ).str.lower()
+    if not base_names.isin(("defas", "defasagem")).any():
         raise ValueError(
             f"Nenhuma coluna de defasagem encontrada para year={year}. "
             f"Colunas disponíveis: {list(normalized.columns)}"
@@ -168,12 +310,17 @@ def load_year(path: str | Path, year: int) -> pd.DataFrame:
 def load_pede_workbook(
     file_path: str | Path,
     sheets_by_year: Mapping[int, str] | None = None,
+    max_workers: int | None = None,
     **read_excel_kwargs: object,
 ) -> dict[int, pd.DataFrame]:
-    """Compatibility wrapper: load workbook raw then harmonize/align yearly schemas."""
+    """Compatibility wrapper: load workbook raw then harmonize/align yearly schemas.
+
+    `max_workers > 1` parses the yearly sheets concurrently on a thread pool.
+    """
     typed_datasets, _, _ = load_pede_workbook_with_metadata(
         file_path=file_path,
         sheets_by_year=sheets_by_year,
+        max_workers=max_workers,
         **read_excel_kwargs,
     )
     return typed_datasets
@@ -182,24 +329,29 @@ def load_pede_workbook(
 def load_pede_workbook_with_metadata(
     file_path: str | Path,
     sheets_by_year: Mapping[int, str] | None = None,
+    max_workers: int | None = None,
+    persist_async: bool = False,
     **read_excel_kwargs: object,
 ) -> tuple[dict[int, pd.DataFrame], dict[str, Any], dict[int, dict[str, Any]]]:
-    """Load workbook and return typed yearly frames with schema/coercion metadata."""
+    """Load workbook and return typed yearly frames with schema/coercion metadata.
+
+    With `persist_async=True` the category report is written on a background thread;
+    call `wait_for_report_writes()` before reading it back.
+    """
     resolved_mapping = dict(sheets_by_year or YEAR_TO_SHEET)
     path_obj = _ensure_dataset_exists(file_path)
 
     if resolved_mapping == YEAR_TO_SHEET and not read_excel_kwargs:
-        raw_datasets = load_pede_workbook_raw(path_obj)
+        raw_datasets = load_pede_workbook_raw(path_obj, max_workers=max_workers)
     else:
-        raw_datasets = {}
-        for year, sheet_name in resolved_mapping.items():
+        for year in resolved_mapping:
             _validate_year(year)
-            raw_datasets[year] = _load_sheet_from_workbook(
-                path_obj,
-                year,
-                sheet_name,
-                read_excel_kwargs=read_excel_kwargs,
-            )
+        raw_datasets = _load_sheets(
+            path_obj,
+            resolved_mapping,
+            read_excel_kwargs,
+            max_workers=max_workers,
+        )
 
     standardized: dict[int, pd.DataFrame] = {}
     for year, df in raw_datasets.items():
@@ -222,11 +374,20 @@ def load_pede_workbook_with_metadata(
         ra_sets=ra_sets,
         invalid_counts=invalid_counts,
     )
-    persist_category_normalization_report(
-        category_report,
-        output_dir="artifacts",
-        write_markdown=False,
-    )
+    if persist_async:
+        # Snapshot the report: callers receive it in the metadata and may mutate it meanwhile.
+        _submit_report_write(
+            persist_category_normalization_report,
+            copy.deepcopy(category_report),
+            output_dir="artifacts",
+            write_markdown=False,
+        )
+    else:
+        persist_category_normalization_report(
+            category_report,
+            output_dir="artifacts",
+            write_markdown=False,
+        )
     return categorized_datasets, align_metadata, coercion_report
 
 
@@ -243,15 +404,44 @@ def make_target(defasagem_next: pd.Series) -> pd.Series:
             "Remova pares com target ausente/inválido antes de calcular y."
         )
 
-    target = (defasagem_next < 0).astype(int)
-    target.name = "target"
-    return target
+    # Compare on the raw ndarray: one vectorized pass with no intermediate boolean Series.
+    is_negative = np.less(defasagem_next.to_numpy(dtype="float64"), 0.0)
+    return pd.Series(is_negative.astype(int), index=defasagem_next.index, name="target")
 
 
 def _is_blank_text(value: object) -> bool:
     return isinstance(value, str) and value.strip() == ""
 
 
+def _blank_text_mask(values: pd.Series) -> pd.Series:
+    """Flag string cells that are empty after stripping, vectorized through `.str`."""
+    if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+        return pd.Series(False, index=values.index)
+    try:
+        stripped = values.str.strip()
+    except (AttributeError, TypeError):
+        # `.str` rejects object columns inferred as numbers or bytes; check cell by cell there.
+        return values.map(_is_blank_text).astype(bool)
+    return stripped.eq("").fillna(False).astype(bool)
+
+
+def _classify_target(
+    raw_target: pd.Series,
+) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+    """Split a raw target into numeric values plus missing/invalid/valid masks."""
+    if pd.api.types.is_numeric_dtype(raw_target):
+        # Already numeric: no blank text or unparseable token can occur, one null pass suffices.
+        valid_mask = raw_target.notna()
+        invalid_mask = pd.Series(False, index=raw_target.index)
+        return raw_target, ~valid_mask, invalid_mask, valid_mask
+
+    missing_mask = raw_target.isna() | _blank_text_mask(raw_target)
+    numeric_target = pd.to_numeric(raw_target, errors="coerce")
+    valid_mask = numeric_target.notna()
+    invalid_mask = ~(missing_mask | valid_mask)
+    return numeric_target, missing_mask, invalid_mask, valid_mask
+
+
 def make_temporal_pairs(
     df_t: pd.DataFrame,
     df_t1: pd.DataFrame,
@@ -263,15 +453,17 @@ def make_temporal_pairs(
     """Create temporal pairs X(t) -> y(t+1) with inner cohort by RA."""
     required_cols_t = {"RA"}
     required_cols_t1 = {"RA", "Defasagem"}
+    existing_cols_t = frozenset(df_t.columns)
+    existing_cols_t1 = frozenset(df_t1.columns)
 
-    missing_t = required_cols_t - set(df_t.columns)
+    missing_t = required_cols_t - existing_cols_t
     if missing_t:
         raise ValueError(
             f"Colunas obrigatórias ausentes em year={year_t}: {sorted(missing_t)}. "
             f"Colunas disponíveis: {list(df_t.columns)}"
         )
 
-    missing_t1 = required_cols_t1 - set(df_t1.columns)
+    missing_t1 = required_cols_t1 - existing_cols_t1
     if missing_t1:
         raise ValueError(
             f"Colunas obrigatórias ausentes em year={year_t1}: {sorted(missing_t1)}. "
@@ -281,13 +473,15 @@ def make_temporal_pairs(
     feature_cols_t = [col for col in df_t.columns if col != "RA"]
 
     next_target_col = "__defasagem_next__"
-    while next_target_col in df_t.columns:
+    while next_target_col in existing_cols_t:
         next_target_col = f"_{next_target_col}"
 
     t1_target = df_t1[["RA", "Defasagem"]].rename(columns={"Defasagem": next_target_col})
-    cohort_pairs = df_t.merge(t1_target, on="RA", how="inner")
+    # RA stays in its standardized string dtype: a categorical cast to get integer join codes
+    # costs more than the hash join it replaces at this cohort size.
+    cohort_pairs = df_t.merge(t1_target, on="RA", how="inner", sort=False)
 
-    expected_after_merge = set(df_t.columns) | {next_target_col}
+    expected_after_merge = existing_cols_t | {next_target_col}
     observed_after_merge = set(cohort_pairs.columns)
     if observed_after_merge != expected_after_merge:
         extras = sorted(observed_after_merge - expected_after_merge)
@@ -298,29 +492,27 @@ def make_temporal_pairs(
         )
 
     raw_target = cohort_pairs[next_target_col]
-    missing_mask = raw_target.isna() | raw_target.map(_is_blank_text)
-    numeric_target = pd.to_numeric(raw_target, errors="coerce")
-    invalid_mask = (~missing_mask) & numeric_target.isna()
-    valid_mask = numeric_target.notna()
+    numeric_target, missing_mask, invalid_mask, valid_mask = _classify_target(raw_target)
 
     total_pairs = len(cohort_pairs)
     missing_count = int(missing_mask.sum())
     invalid_count = int(invalid_mask.sum())
     valid_pairs = int(valid_mask.sum())
 
-    filtered = cohort_pairs.loc[valid_mask].copy()
-    ids = filtered["RA"].copy()
+    # Mask rows and columns in one .loc each instead of materializing the filtered pairs;
+    # both selections already return new objects, so no extra copies are needed.
+    ids = cohort_pairs["RA"].loc[valid_mask]
     ids.name = "RA"
 
     y = make_target(numeric_target.loc[valid_mask])
-    X_raw = filtered.loc[:, feature_cols_t].copy()
+    X_raw = cohort_pairs.loc[valid_mask, feature_cols_t]
     feature_cols = get_feature_columns(X_raw)
     numeric_cols, categorical_cols, datetime_cols, feature_split_report = (
         split_numeric_categorical_datetime(X_raw, feature_cols)
     )
     feature_split_report["year_t"] = year_t
     feature_split_report["year_t1"] = year_t1
-    X = X_raw.loc[:, feature_cols].copy()
+    X = X_raw.loc[:, feature_cols]
 
     leakage_report = detect_leakage_columns(
         X=X,
@@ -331,13 +523,12 @@ def make_temporal_pairs(
     )
     dropped_suspect_all_missing: list[str] = []
     if leakage_report["n_suspect"] > 0:
-        dropped_suspect_all_missing = sorted(
-            [
-                column
-                for column in leakage_report["suspect_columns"]
-                if column in X.columns and X[column].isna().all()
-            ]
-        )
+        suspects_in_x = [
+            column for column in leakage_report["suspect_columns"] if column in X.columns
+        ]
+        # One columnar null pass over every suspect instead of a probe per column.
+        all_missing = X[suspects_in_x].isna().all(axis=0)
+        dropped_suspect_all_missing = sorted(all_missing.index[all_missing.to_numpy()])
         if dropped_suspect_all_missing:
             X = X.drop(columns=dropped_suspect_all_missing)
             _logger.warning(
@@ -356,13 +547,14 @@ def make_temporal_pairs(
         include_year_specific=True,
     )
 
-    numeric_cols = [column for column in numeric_cols if column in X.columns]
-    categorical_cols = [column for column in categorical_cols if column in X.columns]
-    datetime_cols = [column for column in datetime_cols if column in X.columns]
+    kept_cols = frozenset(X.columns)
+    numeric_cols = [column for column in numeric_cols if column in kept_cols]
+    categorical_cols = [column for column in categorical_cols if column in kept_cols]
+    datetime_cols = [column for column in datetime_cols if column in kept_cols]
     all_missing_after_leakage = [
         column
         for column in feature_split_report["all_missing_cols_no_recorte"]
-        if column in X.columns
+        if column in kept_cols
     ]
     feature_split_report["n_total_features"] = len(X.columns)
     feature_split_report["n_numeric"] = len(numeric_cols)
@@ -385,29 +577,29 @@ def make_temporal_pairs(
         raise ValueError(
             f"X contém coluna futura do target em {year_t}->{year_t1}: {next_target_col}"
         )
-    if not set(X.columns).issubset(set(feature_cols_t)):
-        unexpected = sorted(set(X.columns) - set(feature_cols_t))
+    unexpected_cols = X.columns.difference(feature_cols_t)
+    if len(unexpected_cols):
+        unexpected = sorted(unexpected_cols)
         raise ValueError(
             f"X contém colunas fora de year_t em {year_t}->{year_t1}: {unexpected}"
         )
-    leaked_t1_only_cols = [col for col in X.columns if col in df_t1.columns and col not in df_t.columns]
-    if leaked_t1_only_cols:
+    leaked_mask = X.columns.isin(existing_cols_t1) & ~X.columns.isin(existing_cols_t)
+    if leaked_mask.any():
+        leaked_t1_only_cols = X.columns[leaked_mask].tolist()
         raise ValueError(
             f"X contém colunas exclusivas de year_t1 em {year_t}->{year_t1}: {leaked_t1_only_cols}"
         )
-    merge_suffix_cols = [
-        col
-        for col in X.columns
-        if col.endswith("_x") or col.endswith("_y") or col.endswith("_t1")
-    ]
-    if merge_suffix_cols:
+    suffix_mask = X.columns.str.endswith(("_x", "_y", "_t1"), na=False)
+    if suffix_mask.any():
+        merge_suffix_cols = X.columns[suffix_mask].tolist()
         raise ValueError(
             f"X contém sufixos de merge inesperados em {year_t}->{year_t1}: {merge_suffix_cols}"
         )
     if len(X) != len(y):
         raise ValueError("Inconsistência: len(X) difere de len(y).")
-    unique_target_values = set(y.unique().tolist())
-    if not unique_target_values.issubset({0, 1}):
+    y_values = y.to_numpy()
+    if ((y_values != 0) & (y_values != 1)).any():
+        unique_target_values = set(y.unique().tolist())
         raise ValueError(f"Target inválido; valores encontrados: {sorted(unique_target_values)}")
 
     prevalence = float(y.mean()) if len(y) else 0.0
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -22,7 +23,9 @@ _NUMERIC_TEXT_RE = re.compile(r"^[+-]?\d+(?:[\.,]\d+)?$")
 _YEAR_FIRST_DATE_RE = re.compile(r"^\d{4}[-/]\d{1,2}[-/]\d{1,2}")
 _AGE_NUMBER_RE = re.compile(r"(\d{1,3})(?:[.,]\d+)?")
 
-_INVALID_NUMERIC_TOKENS = {"INCLUIR"}
+_IS_STR = np.frompyfunc(str.__instancecheck__, 1, 1)
+
+_INVALID_NUMERIC_TOKENS = frozenset({"INCLUIR"})
 _INVALID_AGE_TOKENS = {"INCLUIR", "ALFA", "#N/A", "#DIV/0!", "N/A"}
 _INVALID_AGE_TOKENS_CASEFOLD = {token.casefold() for token in _INVALID_AGE_TOKENS}
 
@@ -74,6 +77,18 @@ def _is_datetime_scalar(value: object) -> bool:
 
 
 def _normalize_blank_strings(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+        return series.copy()
+    if pd.api.types.is_object_dtype(series):
+        # Work on the object ndarray: C-level isinstance ufunc, one `.str` strip, one scatter back.
+        values = series.to_numpy(dtype=object, copy=True)
+        string_mask = _IS_STR(values).astype(bool)
+        if string_mask.any():
+            stripped = pd.Series(values[string_mask], dtype=object).str.strip().to_numpy()
+            stripped[stripped == ""] = pd.NA
+            values[string_mask] = stripped
+        return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
     cleaned = series.copy()
     string_mask = cleaned.map(lambda value: isinstance(value, str))
     if string_mask.any():
@@ -98,8 +113,27 @@ def _convert_numeric_data_nasc(value: float, source_counts: dict[str, int]) -> p
     return pd.to_datetime(numeric_value, unit="D", origin="1899-12-30", errors="coerce")
 
 
+def _numeric_data_nasc_values(
+    values: np.ndarray,
+    source_counts: dict[str, int],
+) -> np.ndarray:
+    """Vectorized `_convert_numeric_data_nasc` over a float array."""
+    year_mask = (values >= 1900) & (values <= 2100) & (values == np.floor(values))
+    source_counts["year"] += int(year_mask.sum())
+    source_counts["excel_serial"] += int((~year_mask).sum())
+
+    converted = np.full(values.shape, np.datetime64("NaT"), dtype="datetime64[ns]")
+    years = values[year_mask].astype("int64")
+    converted[year_mask] = (years - 1970).astype("datetime64[Y]").astype("datetime64[ns]")
+    if (~year_mask).any():
+        serials = pd.to_datetime(
+            values[~year_mask], unit="D", origin="1899-12-30", errors="coerce"
+        )
+        converted[~year_mask] = serials.to_numpy(dtype="datetime64[ns]")
+    return converted
+
+
 def _coerce_data_nasc_series(series: pd.Series) -> tuple[pd.Series, dict[str, int], int]:
-    result = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
     source_counts = {
         "year": 0,
         "excel_serial": 0,
@@ -107,44 +141,66 @@ def _coerce_data_nasc_series(series: pd.Series) -> tuple[pd.Series, dict[str, in
         "datetime": 0,
     }
 
-    for idx, raw_value in series.items():
-        if pd.isna(raw_value):
-            continue
-
+    if pd.api.types.is_datetime64_dtype(series):
+        # Read as a datetime column already: every non-null cell is a datetime source.
+        result = pd.Series(series.to_numpy(dtype="datetime64[ns]", copy=True), index=series.index)
+        source_counts["datetime"] = int(result.notna().sum())
+        return result, source_counts, int(result.isna().sum())
+
+    values = series.to_numpy(dtype=object)
+    result_values = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+    numeric_positions: list[int] = []
+    numeric_values: list[float] = []
+    text_positions: list[int] = []
+    texts: list[str] = []
+    scalar_positions: list[int] = []
+
+    # One cheap classification pass; the conversions below then run once per bucket.
+    for position in np.flatnonzero(~pd.isna(values)):
+        raw_value = values[position]
         if _is_datetime_scalar(raw_value):
-            parsed = pd.to_datetime(raw_value, errors="coerce")
-            result.loc[idx] = parsed
-            if pd.notna(parsed):
-                source_counts["datetime"] += 1
-            continue
-
-        if isinstance(raw_value, (int, float)) and not isinstance(raw_value, bool):
-            result.loc[idx] = _convert_numeric_data_nasc(raw_value, source_counts)
-            continue
-
-        if isinstance(raw_value, str):
+            scalar_positions.append(position)
+        elif isinstance(raw_value, (int, float)) and not isinstance(raw_value, bool):
+            numeric_positions.append(position)
+            numeric_values.append(float(raw_value))
+        elif isinstance(raw_value, str):
             text_value = raw_value.strip()
-            if text_value == "":
-                continue
-
-            numeric_candidate = pd.to_numeric(text_value.replace(",", "."), errors="coerce")
-            if pd.notna(numeric_candidate):
-                result.loc[idx] = _convert_numeric_data_nasc(float(numeric_candidate), source_counts)
+            if text_value != "":
+                text_positions.append(position)
+                texts.append(text_value)
+        else:
+            scalar_positions.append(position)
+
+    if texts:
+        text_numbers = pd.to_numeric(
+            pd.Series([text.replace(",", ".") for text in texts], dtype=object),
+            errors="coerce",
+        ).to_numpy(dtype="float64", na_value=np.nan)
+        for position, text_value, number in zip(text_positions, texts, text_numbers):
+            if not np.isnan(number):
+                numeric_positions.append(position)
+                numeric_values.append(float(number))
                 continue
-
             parsed = _parse_datetime_text(text_value)
-            result.loc[idx] = parsed
             if pd.notna(parsed):
+                result_values[position] = parsed.to_datetime64()
                 source_counts["string"] += 1
-            continue
 
+    if numeric_positions:
+        result_values[numeric_positions] = _numeric_data_nasc_values(
+            np.asarray(numeric_values, dtype="float64"), source_counts
+        )
+
+    for position in scalar_positions:
+        raw_value = values[position]
         parsed = pd.to_datetime(raw_value, errors="coerce")
-        result.loc[idx] = parsed
-        if pd.notna(parsed):
-            source_counts["string"] += 1
+        if pd.isna(parsed):
+            continue
+        result_values[position] = parsed.to_datetime64()
+        source_counts["datetime" if _is_datetime_scalar(raw_value) else "string"] += 1
 
-    n_nat_data_nasc = int(result.isna().sum())
-    return result, source_counts, n_nat_data_nasc
+    result = pd.Series(result_values, index=series.index)
+    return result, source_counts, int(result.isna().sum())
 
 
 def _is_datetime_like_string(value: object) -> bool:
@@ -165,6 +221,7 @@ def _is_datetime_like_string(value: object) -> bool:
     return pd.notna(parsed)
 
 
+@lru_cache(maxsize=4096)
 def _parse_datetime_text(text: str) -> pd.Timestamp | pd.NaT:
     normalized = text.strip()
     if _YEAR_FIRST_DATE_RE.match(normalized):
@@ -191,6 +248,26 @@ def _recover_age_from_datetime(value: object, *, year: int | None) -> int | None
     return None
 
 
+def _parse_age_text(text: str, *, year: int | None) -> tuple[int | None, tuple[str, ...]]:
+    """Parse one stripped age string into (age or None, report counters to increment)."""
+    if text == "":
+        return None, ("n_invalid_tokens", "non_numeric_to_nan")
+    if text.casefold() in _INVALID_AGE_TOKENS_CASEFOLD:
+        return None, ("n_invalid_tokens", "n_invalid_tokens_replaced", "non_numeric_to_nan")
+
+    parsed_dt = pd.to_datetime(text, errors="coerce")
+    if pd.notna(parsed_dt):
+        recovered = _recover_age_from_datetime(parsed_dt, year=year)
+        if recovered is not None:
+            return recovered, ("n_recovered_excel_date",)
+        return None, ("n_invalid_datetime_like", "datetime_string_to_nan")
+
+    match = _AGE_NUMBER_RE.search(text)
+    if not match:
+        return None, ("n_invalid_tokens", "non_numeric_to_nan")
+    return int(match.group(1)), ()
+
+
 def parse_age_series(
     series: pd.Series,
     *,
@@ -200,7 +277,6 @@ def parse_age_series(
     original = series.copy()
     normalized = _normalize_blank_strings(original)
 
-    parsed = pd.Series(pd.NA, index=series.index, dtype="Int64")
     report = {
         "n_original_non_null": int(original.notna().sum()),
         "n_parsed_numeric_ok": 0,
@@ -218,10 +294,13 @@ def parse_age_series(
         "fractional_to_nan": 0,
     }
 
-    for idx, value in normalized.items():
-        if pd.isna(value):
-            continue
+    values = normalized.to_numpy(dtype=object)
+    ages: list[Any] = [pd.NA] * len(values)
+    # Age columns repeat a few dozen distinct strings; parse each one (to_datetime included) once.
+    parsed_texts: dict[str, tuple[int | None, tuple[str, ...]]] = {}
 
+    for position in np.flatnonzero(~pd.isna(values)):
+        value = values[position]
         age_value: int | None = None
 
         if _is_datetime_scalar(value):
@@ -233,35 +312,11 @@ def parse_age_series(
                 report["n_invalid_datetime_like"] += 1
                 report["datetime_object_to_nan"] += 1
         elif isinstance(value, str):
-            text = value.strip()
-            if text == "":
-                report["n_invalid_tokens"] += 1
-                report["non_numeric_to_nan"] += 1
-                continue
-
-            if text.casefold() in _INVALID_AGE_TOKENS_CASEFOLD:
-                report["n_invalid_tokens"] += 1
-                report["n_invalid_tokens_replaced"] += 1
-                report["non_numeric_to_nan"] += 1
-                continue
-
-            parsed_dt = pd.to_datetime(text, errors="coerce")
-            if pd.notna(parsed_dt):
-                recovered = _recover_age_from_datetime(parsed_dt, year=year)
-                if recovered is not None:
-                    age_value = recovered
-                    report["n_recovered_excel_date"] += 1
-                else:
-                    report["n_invalid_datetime_like"] += 1
-                    report["datetime_string_to_nan"] += 1
-                    continue
-            else:
-                match = _AGE_NUMBER_RE.search(text)
-                if not match:
-                    report["n_invalid_tokens"] += 1
-                    report["non_numeric_to_nan"] += 1
-                    continue
-                age_value = int(match.group(1))
+            if value not in parsed_texts:
+                parsed_texts[value] = _parse_age_text(value.strip(), year=year)
+            age_value, counters = parsed_texts[value]
+            for counter in counters:
+                report[counter] += 1
         elif isinstance(value, (int, float)) and not isinstance(value, bool):
             numeric_value = float(value)
             rounded = round(numeric_value)
@@ -283,13 +338,34 @@ def parse_age_series(
             report["n_out_of_range"] += 1
             continue
 
-        parsed.loc[idx] = age_value
+        ages[position] = age_value
 
+    parsed = pd.Series(ages, index=series.index, dtype="Int64")
     non_null_original_mask = normalized.notna()
     final_na_non_null = int(parsed[non_null_original_mask].isna().sum())
     report["n_final_na"] = int(parsed.isna().sum())
     report["n_coerced_to_na"] = final_na_non_null
-    return parsed.astype("Int64"), report
+    return parsed, report
+
+
+def _invalid_numeric_token_mask(series: pd.Series) -> pd.Series:
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return series.map(
+            lambda value: isinstance(value, str)
+            and value.strip().upper() in _INVALID_NUMERIC_TOKENS
+        )
+    # Only string cells can hold a token: test each distinct text once, then one hash `isin`.
+    values = series.to_numpy(dtype=object)
+    string_mask = _IS_STR(values).astype(bool)
+    token_mask = np.zeros(len(values), dtype=bool)
+    if string_mask.any():
+        texts = values[string_mask]
+        hits = [
+            text for text in pd.unique(texts) if text.strip().upper() in _INVALID_NUMERIC_TOKENS
+        ]
+        if hits:
+            token_mask[string_mask] = pd.Series(texts, dtype=object).isin(hits).to_numpy()
+    return pd.Series(token_mask, index=series.index)
 
 
 def _coerce_numeric_series(
@@ -298,13 +374,23 @@ def _coerce_numeric_series(
     as_integer: bool,
 ) -> tuple[pd.Series, dict[str, int]]:
     original_non_null = int(series.notna().sum())
-    cleaned = _normalize_blank_strings(series)
-
-    token_mask = cleaned.map(
-        lambda value: isinstance(value, str) and value.strip().upper() in _INVALID_NUMERIC_TOKENS
-    )
-    invalid_tokens_replaced = int(token_mask.sum())
-    cleaned = cleaned.mask(token_mask, pd.NA)
+    target_dtype = "Int64" if as_integer else "Float64"
+    if series.dtype == target_dtype:
+        # Already in the contract dtype (typed at read time or re-standardized): nothing to coerce.
+        return series.copy(), {
+            "n_original_non_null": original_non_null,
+            "invalid_tokens_replaced": 0,
+            "coerced_to_nan": 0,
+        }
+    if pd.api.types.is_numeric_dtype(series):
+        # Typed at read time (clean numeric sheet column): no text cells to clean or replace.
+        cleaned = series
+        invalid_tokens_replaced = 0
+    else:
+        cleaned = _normalize_blank_strings(series)
+        token_mask = _invalid_numeric_token_mask(cleaned)
+        invalid_tokens_replaced = int(token_mask.sum())
+        cleaned = cleaned.mask(token_mask, pd.NA)
 
     numeric = pd.to_numeric(cleaned, errors="coerce")
     coerced_to_nan = int((cleaned.notna() & numeric.isna()).sum())
@@ -335,7 +421,8 @@ def standardize_dtypes(
 ) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Standardize yearly dataframe dtypes using explicit PEDE data contracts."""
     log = logger or _logger
-    standardized = df.copy()
+    # Converted columns are collected and assembled once instead of copying the whole frame.
+    new_cols: dict[Any, pd.Series] = {}
     report: dict[str, Any] = {
         "year": year,
         "coercions": {},
@@ -366,18 +453,18 @@ def standardize_dtypes(
         "dtypes_final": {},
     }
 
-    if "RA" in standardized.columns:
-        standardized["RA"] = _to_clean_string(standardized["RA"])
+    if "RA" in df.columns:
+        new_cols["RA"] = _to_clean_string(df["RA"])
 
-    for column in list(standardized.columns):
+    for column in df.columns:
         base_column = _base_column_name(column)
 
         if base_column == "RA":
             continue
 
         if base_column == "Data_Nasc":
-            converted, source_counts, n_nat = _coerce_data_nasc_series(standardized[column])
-            standardized[column] = converted
+            converted, source_counts, n_nat = _coerce_data_nasc_series(df[column])
+            new_cols[column] = converted
             report["n_nat_data_nasc"] += n_nat
             for key, value in source_counts.items():
                 report["data_nasc_sources"][key] += value
@@ -385,9 +472,9 @@ def standardize_dtypes(
 
         if base_column == "Idade":
             converted_idade, idade_report = parse_age_series(
-                standardized[column], year=year
+                df[column], year=year
             )
-            standardized[column] = converted_idade
+            new_cols[column] = converted_idade
             report["idade"] = {
                 key: report["idade"][key] + idade_report[key]
                 for key in report["idade"]
@@ -403,10 +490,10 @@ def standardize_dtypes(
 
         if base_column in _INTEGER_BASE_COLUMNS:
             converted, numeric_report = _coerce_numeric_series(
-                standardized[column],
+                df[column],
                 as_integer=True,
             )
-            standardized[column] = converted
+            new_cols[column] = converted
             report["coercions"][column] = numeric_report["coerced_to_nan"]
             if numeric_report["invalid_tokens_replaced"]:
                 report["invalid_tokens_replaced"][column] = numeric_report[
@@ -422,10 +509,10 @@ def standardize_dtypes(
 
         if base_column in _FLOAT_BASE_COLUMNS:
             converted, numeric_report = _coerce_numeric_series(
-                standardized[column],
+                df[column],
                 as_integer=False,
             )
-            standardized[column] = converted
+            new_cols[column] = converted
             report["coercions"][column] = numeric_report["coerced_to_nan"]
             if numeric_report["invalid_tokens_replaced"]:
                 report["invalid_tokens_replaced"][column] = numeric_report[
@@ -439,16 +526,22 @@ def standardize_dtypes(
             }
             continue
 
-    for column in list(standardized.columns):
+    for column in df.columns:
         base_column = _base_column_name(column)
         if base_column in _FORCE_STRING_COLUMNS:
-            standardized[column] = _to_clean_string(standardized[column])
+            new_cols[column] = _to_clean_string(new_cols.get(column, df[column]))
             continue
-        if base_column in _INTEGER_BASE_COLUMNS | _FLOAT_BASE_COLUMNS | {"Data_Nasc", "RA"}:
+        if column in new_cols:
             continue
-        if pd.api.types.is_datetime64_any_dtype(standardized[column]):
+        if base_column in _INTEGER_BASE_COLUMNS | _FLOAT_BASE_COLUMNS | {
+            "Data_Nasc",
+            "RA",
+        } or pd.api.types.is_datetime64_any_dtype(df[column]):
+            new_cols[column] = df[column].copy()
             continue
-        standardized[column] = _to_clean_string(standardized[column])
+        new_cols[column] = _to_clean_string(df[column])
+
+    standardized = pd.DataFrame(new_cols, index=df.index, columns=df.columns, copy=False)
 
     report["dtypes_final"] = {
         column: str(dtype)
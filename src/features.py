@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +48,18 @@ def get_feature_columns(
     return feature_cols
 
 
+@lru_cache(maxsize=None)
+def _dtype_family(dtype: Any) -> str:
+    # Yearly frames share a handful of dtypes, so each one is classified once per process.
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "categorical"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    return "categorical"
+
+
 def split_numeric_categorical_datetime(
     X: pd.DataFrame,
     feature_cols: list[str],
@@ -60,16 +73,14 @@ def split_numeric_categorical_datetime(
     categorical_cols: list[str] = []
     datetime_cols: list[str] = []
 
+    families = {
+        "numeric": numeric_cols,
+        "categorical": categorical_cols,
+        "datetime": datetime_cols,
+    }
+    dtypes = X.dtypes
     for column in feature_cols:
-        series = X[column]
-        if pd.api.types.is_datetime64_any_dtype(series):
-            datetime_cols.append(column)
-        elif pd.api.types.is_bool_dtype(series):
-            categorical_cols.append(column)
-        elif pd.api.types.is_numeric_dtype(series):
-            numeric_cols.append(column)
-        else:
-            categorical_cols.append(column)
+        families[_dtype_family(dtypes[column])].append(column)
 
     excluded_cols = [column for column in X.columns if column not in feature_cols]
     all_missing_cols = [column for column in feature_cols if X[column].isna().all()]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -44,14 +45,35 @@ def build_blacklist_patterns(
     return sorted(set(patterns))
 
 
-def _compile_patterns(patterns: list[str]) -> list[re.Pattern[str]]:
-    return [re.compile(pattern, flags=re.IGNORECASE) for pattern in patterns]
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    return tuple(re.compile(pattern, flags=re.IGNORECASE) for pattern in patterns)
 
 
-def _matches_any_pattern(value: str, compiled: list[re.Pattern[str]]) -> bool:
+def _matches_any_pattern(value: str, compiled: tuple[re.Pattern[str], ...]) -> bool:
     return any(pattern.search(value) for pattern in compiled)
 
 
+@lru_cache(maxsize=128)
+def _suspect_columns(
+    columns: tuple[Any, ...],
+    patterns: tuple[str, ...],
+    allowlist: frozenset[str],
+) -> tuple[str, ...]:
+    # Detection depends only on column names, so repeated folds over one year pair hit the cache.
+    compiled_blacklist = _compile_patterns(patterns)
+    suspect_columns: set[str] = set()
+    for column in columns:
+        normalized = str(column).strip()
+        if not normalized:
+            continue
+        if normalized.lower() in allowlist:
+            continue
+        if _matches_any_pattern(normalized, compiled_blacklist):
+            suspect_columns.add(str(column))
+    return tuple(sorted(suspect_columns))
+
+
 def detect_leakage_columns(
     X: pd.DataFrame,
     year_t: int | None = None,
@@ -72,23 +94,15 @@ def detect_leakage_columns(
     if extra_blacklist:
         patterns = sorted(set(patterns + list(extra_blacklist)))
 
-    compiled_blacklist = _compile_patterns(patterns)
-    allowlist_set = {name.strip().lower() for name in (allowlist or []) if name.strip()}
-
-    suspect_columns: list[str] = []
-    for column in X.columns:
-        normalized = str(column).strip()
-        if not normalized:
-            continue
-        if normalized.lower() in allowlist_set:
-            continue
-        if _matches_any_pattern(normalized, compiled_blacklist):
-            suspect_columns.append(str(column))
+    allowlist_set = frozenset(
+        name.strip().lower() for name in (allowlist or []) if name.strip()
+    )
+    suspect_columns = _suspect_columns(tuple(X.columns), tuple(patterns), allowlist_set)
 
     return {
         "n_columns": int(X.shape[1]),
         "n_suspect": len(suspect_columns),
-        "suspect_columns": sorted(set(suspect_columns)),
+        "suspect_columns": list(suspect_columns),
         "patterns_used": sorted(set(patterns)),
     }
 
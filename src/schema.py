@@ -35,14 +35,14 @@ def _validate_year(year: int) -> None:
 
 def normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
     """Apply strip normalization to column headers."""
-    normalized = df.copy()
+    normalized = df.copy(deep=False)
     normalized.columns = [str(col).strip() for col in normalized.columns]
     return normalized
 
 
 def resolve_duplicate_headers(df: pd.DataFrame) -> tuple[pd.DataFrame, dict[str, str]]:
     """Rename duplicated header suffixes (.1/.2/...) into deterministic __dupN names."""
-    resolved = df.copy()
+    resolved = df.copy(deep=False)
     original_cols = [str(col) for col in resolved.columns]
     occupied = set(original_cols)
     new_cols: list[str] = []
@@ -102,8 +102,8 @@ def harmonize_schema_year_with_report(
     before_shape = df.shape
     normalized = normalize_headers(df)
     deduped, dup_rename_map = resolve_duplicate_headers(normalized)
-    mapped, mapping_report = harmonize_year_columns(deduped, year=year, strict=False)
-    harmonized = mapped.copy()
+    # Header steps only relabel shallow views; the crosswalk below owns the one data copy.
+    harmonized, mapping_report = harmonize_year_columns(deduped, year=year, strict=False)
 
     inde_series, inde_source = select_with_fallback(harmonized, _INDE_CANDIDATES_BY_YEAR[year])
     if inde_series is None:
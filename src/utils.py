@@ -1,12 +1,18 @@
-"""Shared logging utilities for consistent project observability."""
+"""Shared logging and artifact utilities for consistent project observability."""
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None
 
 _DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 _LOG_FORMAT: Final[str] = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
@@ -111,3 +117,16 @@ def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.propagate = True
     return logger
+
+
+def json_bytes(payload: Any) -> bytes:
+    """Serialize payload as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(payload, option=options)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json(path: str | Path, payload: Any) -> None:
+    """Write payload as indented UTF-8 JSON, using orjson when it is installed."""
+    Path(path).write_bytes(json_bytes(payload))
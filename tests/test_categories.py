@@ -64,6 +64,28 @@ def test_normalize_categories_pedra_mapping() -> None:
     assert pd.isna(normalized.loc[3, "Pedra_Ano"])
 
 
+def test_normalize_categories_repeated_values_keep_row_alignment() -> None:
+    df = pd.DataFrame(
+        {
+            "RA": ["1", "2", "3", "4", "5"],
+            "Pedra 22": ["Agata", "INCLUIR", " agata ", pd.NA, "Agata"],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+    normalized, report = normalize_categories(df, year=2022)
+
+    result = normalized["Pedra 22"]
+    assert str(result.dtype) == "string"
+    assert result.index.tolist() == [10, 11, 12, 13, 14]
+    assert result.loc[10] == "Ágata"
+    assert pd.isna(result.loc[11])
+    assert result.loc[12] == "Ágata"
+    assert pd.isna(result.loc[13])
+    assert result.loc[14] == "Ágata"
+    assert report["columns"]["Pedra 22"]["n_changed"] == 4
+
+
 def test_normalize_categories_turma_uppercase() -> None:
     df = pd.DataFrame({"RA": ["1", "2"], "Turma": ["7e", " 8D "]})
 
@@ -123,3 +145,54 @@ def test_pipeline_dtypes_categories_and_validate_skip_fase_numeric_coercion(
     coercion_columns = [item["column"] for item in report["years"]["2024"]["coercion_summary"]]
     assert "Fase" not in coercion_columns
     assert "Fase_Ideal" not in coercion_columns
+
+
+def test_normalize_categories_all_process_pool_matches_serial() -> None:
+    dfs = {
+        2022: pd.DataFrame({"RA": ["1", "2"], "Gênero": ["Menina", "Menino"]}),
+        2023: pd.DataFrame({"RA": ["1", "2"], "Pedra_Ano": ["Agata", "INCLUIR"]}),
+    }
+
+    serial, serial_report = normalize_categories_all(dfs)
+    parallel, parallel_report = normalize_categories_all(dfs, max_workers=2)
+
+    assert sorted(parallel) == [2022, 2023]
+    for year in dfs:
+        pd.testing.assert_frame_equal(parallel[year], serial[year])
+        assert parallel_report[year] == serial_report[year]
+
+
+def test_normalize_categories_categorical_input_returns_string() -> None:
+    df = pd.DataFrame(
+        {
+            "RA": ["1", "2", "3", "4"],
+            "Gênero": pd.Categorical(["Menina", "Menino", pd.NA, "Menina"]),
+            "Turma": pd.Categorical(["7e", " 8D ", "7e", "9a"]),
+        }
+    )
+
+    normalized, report = normalize_categories(df, year=2022)
+
+    assert str(normalized["Gênero"].dtype) == "string"
+    assert normalized["Gênero"].tolist()[:2] == ["Feminino", "Masculino"]
+    assert pd.isna(normalized.loc[2, "Gênero"])
+    assert normalized["Turma"].tolist() == ["7E", "8D", "7E", "9A"]
+    assert report["columns"]["Gênero"]["n_changed"] == 3
+
+
+def test_normalize_categories_duplicate_source_columns_share_result() -> None:
+    values = [" Cursando ", "Cursando", pd.NA]
+    df = pd.DataFrame(
+        {
+            "RA": ["1", "2", "3"],
+            "Ativo/ Inativo": values,
+            "Ativo/ Inativo__dup1": values,
+        }
+    )
+
+    normalized, report = normalize_categories(df, year=2024)
+
+    expected = ["Cursando", "Cursando", pd.NA]
+    assert normalized["Ativo/ Inativo"].tolist() == expected
+    assert normalized["Ativo/ Inativo__dup1"].tolist() == expected
+    assert report["columns"]["Ativo/ Inativo"] == report["columns"]["Ativo/ Inativo__dup1"]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from src.contract_validate import load_year_contract, validate_frame_against_contract
+from src.contract_validate import (
+    compile_contract,
+    load_year_contract,
+    validate_frame_against_contract,
+    validate_frames_against_contracts,
+)
 
 
 def _mini_contract() -> dict:
@@ -187,3 +194,120 @@ def test_load_year_contract_real_file_contains_expected_columns() -> None:
     contract = load_year_contract(2023, contracts_dir=Path("docs/contracts"))
     assert len(contract["columns"]) == 57
     assert "RA" in contract["columns"]
+
+
+def test_regex_domain_reports_non_matching_values() -> None:
+    contract = _mini_contract()
+    contract["columns"]["RA"]["rules"][2] = {
+        "rule_type": "domain",
+        "enforcement": "error",
+        "spec": {"kind": "regex", "pattern": r"\d+"},
+    }
+    df = _base_df().copy()
+    df.loc[1, "RA"] = "RA-2"
+    report = validate_frame_against_contract(df, 2023, contract)
+    assert report["status"] == "FAIL"
+    regex_findings = [f for f in report["findings"] if f["kind"] == "regex"]
+    assert len(regex_findings) == 1
+    assert regex_findings[0]["metrics"]["n_not_matching"] == 1
+
+
+def test_set_domain_on_categorical_column_matches_string_column() -> None:
+    df = _base_df().copy()
+    df.loc[0, "Gênero"] = "Outro"
+    categorical = df.copy()
+    categorical["Gênero"] = categorical["Gênero"].astype("category")
+    contract = _mini_contract()
+    contract["columns"]["Gênero"]["rules"] = contract["columns"]["Gênero"]["rules"][2:]
+
+    def _set_metrics(frame: pd.DataFrame) -> dict:
+        report = validate_frame_against_contract(frame, 2023, contract)
+        return next(f["metrics"] for f in report["findings"] if f["kind"] == "set")
+
+    assert _set_metrics(categorical) == _set_metrics(df)
+    assert _set_metrics(categorical)["n_not_allowed"] == 1
+
+
+def test_thread_pool_validation_matches_serial() -> None:
+    df = _base_df().copy()
+    df.loc[0, "Idade"] = 50
+    df.loc[1, "Gênero"] = "Outro"
+    serial = validate_frame_against_contract(df, 2023, _mini_contract())
+    threaded = validate_frame_against_contract(df, 2023, _mini_contract(), max_workers=4)
+    assert threaded == serial
+
+
+def test_load_year_contract_rereads_modified_file_and_returns_copies(tmp_path: Path) -> None:
+    path = tmp_path / "data_contract_2023.json"
+    path.write_text('{"year": 2023, "columns": {}}', encoding="utf-8")
+    first = load_year_contract(2023, contracts_dir=tmp_path)
+    first["columns"]["RA"] = {}
+    assert load_year_contract(2023, contracts_dir=tmp_path)["columns"] == {}
+
+    stat = path.stat()
+    path.write_text('{"year": 2023, "columns": {"RA": {}}}', encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert list(load_year_contract(2023, contracts_dir=tmp_path)["columns"]) == ["RA"]
+
+
+def test_date_range_uses_declared_format() -> None:
+    contract = _mini_contract()
+    contract["columns"]["Data_Nasc"]["rules"] = [
+        {
+            "rule_type": "domain",
+            "enforcement": "warning",
+            "spec": {
+                "kind": "date_range",
+                "start": "1990-01-01",
+                "end": "2030-12-31",
+                "format": "%d/%m/%Y",
+            },
+        }
+    ]
+    df = _base_df().copy()
+    df["Data_Nasc"] = pd.Series(["01/02/2011", "2011-02-01"], dtype="string")
+    report = validate_frame_against_contract(df, 2023, contract)
+    finding = next(f for f in report["findings"] if f["kind"] == "date_range")
+    assert finding["metrics"]["n_parse_invalid"] == 1
+    assert finding["metrics"]["n_out_of_range"] == 0
+
+
+def test_sink_receives_findings_instead_of_report_list() -> None:
+    df = _base_df().copy()
+    df.loc[0, "Idade"] = 50
+    expected = validate_frame_against_contract(df, 2023, _mini_contract())
+
+    streamed: list[dict] = []
+    report = validate_frame_against_contract(df, 2023, _mini_contract(), sink=streamed.append)
+    assert streamed == expected["findings"]
+    assert report["findings"] == []
+    assert report["errors_count"] == expected["errors_count"]
+    assert report["status"] == expected["status"]
+
+
+def test_compiled_contract_matches_raw_contract() -> None:
+    compiled = compile_contract(_mini_contract())
+    for df in (_base_df(), _base_df().assign(Idade=pd.Series([50, pd.NA], dtype="Int64"))):
+        assert validate_frame_against_contract(df, 2023, compiled) == (
+            validate_frame_against_contract(df, 2023, _mini_contract())
+        )
+
+
+def test_compile_contract_rejects_malformed_regex() -> None:
+    contract = _mini_contract()
+    contract["columns"]["RA"]["rules"][2]["spec"] = {"kind": "regex", "pattern": "("}
+    with pytest.raises(re.error):
+        compile_contract(contract)
+
+
+def test_batch_validation_matches_per_year_calls() -> None:
+    bad = _base_df().copy()
+    bad.loc[0, "Gênero"] = "Outro"
+    frames = {2023: _base_df(), 2024: bad}
+    contracts = {2023: _mini_contract(), 2024: compile_contract(_mini_contract())}
+    expected = {
+        year: validate_frame_against_contract(frames[year], year, _mini_contract())
+        for year in frames
+    }
+    assert validate_frames_against_contracts(frames, contracts) == expected
+    assert validate_frames_against_contracts(frames, contracts, max_workers=2) == expected
@@ -1,8 +1,11 @@
+import json
+from dataclasses import fields
 from pathlib import Path
 
 import pytest
 
 from src.contracts import (
+    DomainSpec,
     Enforcement,
     Presence,
     export_contracts,
@@ -90,3 +93,54 @@ def test_export_contracts_writes_json_with_metadata(tmp_path: Path) -> None:
 def test_get_year_contract_rejects_invalid_year() -> None:
     with pytest.raises(ValueError, match="Ano inválido"):
         get_year_contract(2025)
+
+
+def test_get_year_contract_returns_independent_copies() -> None:
+    contract = get_year_contract(2024)
+    _get_rule(contract.columns["INDE"], "domain").spec["max"] = 99
+    contract.columns["IAA"] = contract.columns["Idade"]
+
+    fresh = get_year_contract(2024)
+    assert _get_rule(fresh.columns["INDE"], "domain").spec["max"] == 10.5
+    assert _get_rule(fresh.columns["IAA"], "domain").spec["max"] == 10.5
+    assert _get_rule(get_year_contract(2023).columns["INDE"], "domain").spec["max"] == 10.5
+
+
+def test_domain_rule_specs_carry_every_domain_spec_field() -> None:
+    expected_keys = [item.name for item in fields(DomainSpec)]
+    for year in (2022, 2023, 2024):
+        for column_spec in get_year_contract(year).columns.values():
+            assert list(_get_rule(column_spec, "domain").spec) == expected_keys
+
+
+def test_export_contracts_thread_pool_writes_same_files(tmp_path: Path) -> None:
+    serial_dir = tmp_path / "serial"
+    threaded_dir = tmp_path / "threaded"
+    export_contracts(output_dir=serial_dir, dataset_sha256="abc123")
+    export_contracts(output_dir=threaded_dir, dataset_sha256="abc123", max_workers=3)
+
+    for year in (2022, 2023, 2024):
+        serial = json.loads((serial_dir / f"data_contract_{year}.json").read_text(encoding="utf-8"))
+        threaded = json.loads(
+            (threaded_dir / f"data_contract_{year}.json").read_text(encoding="utf-8")
+        )
+        serial["metadata"].pop("generated_at")
+        threaded["metadata"].pop("generated_at")
+        assert threaded == serial
+        md_name = f"data_contract_{year}.md"
+        assert (threaded_dir / md_name).read_text(encoding="utf-8") == (
+            serial_dir / md_name
+        ).read_text(encoding="utf-8")
+
+
+def test_export_contracts_skips_rewrite_when_only_timestamp_changes(tmp_path: Path) -> None:
+    export_contracts(output_dir=tmp_path, dataset_sha256="abc123")
+    json_file = tmp_path / "data_contract_2024.json"
+    first_bytes = json_file.read_bytes()
+
+    export_contracts(output_dir=tmp_path, dataset_sha256="abc123")
+    assert json_file.read_bytes() == first_bytes
+
+    export_contracts(output_dir=tmp_path, dataset_sha256="def456")
+    payload = json.loads(json_file.read_text(encoding="utf-8"))
+    assert payload["metadata"]["dataset_sha256"] == "def456"
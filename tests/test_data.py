@@ -261,6 +261,76 @@ def test_load_pede_workbook_raw_loads_three_years_without_standardization(
     assert "Defasagem" not in datasets[2022].columns
 
 
+def test_load_pede_workbook_raw_opens_workbook_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workbook_path = _write_workbook(
+        tmp_path,
+        {
+            "PEDE2022": pd.DataFrame({"RA": [1], "Defas": [-1]}),
+            "PEDE2023": pd.DataFrame({"RA": [1], "Defasagem": [0]}),
+            "PEDE2024": pd.DataFrame({"RA": [1], "Defasagem": [1]}),
+        },
+    )
+    opened: list[object] = []
+    original_excel_file = pd.ExcelFile
+
+    def counting_excel_file(*args: object, **kwargs: object) -> pd.ExcelFile:
+        opened.append(args[0])
+        return original_excel_file(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "ExcelFile", counting_excel_file)
+
+    datasets = data.load_pede_workbook_raw(workbook_path)
+
+    assert set(datasets.keys()) == {2022, 2023, 2024}
+    assert len(opened) == 1
+
+
+def test_load_pede_workbook_raw_reuses_sheet_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workbook_path = _write_workbook(
+        tmp_path,
+        {
+            "PEDE2022": pd.DataFrame({"RA": [1], "Defas": [-1], "INDE 22": ["INCLUIR"]}),
+            "PEDE2023": pd.DataFrame({"RA": [1], "Defasagem": [0]}),
+            "PEDE2024": pd.DataFrame({"RA": [1], "Defasagem": [1]}),
+        },
+    )
+    monkeypatch.setenv("DATASET_CACHE_DIR", str(tmp_path / "cache"))
+    first = data.load_pede_workbook_raw(workbook_path)
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 3
+
+    def failing_excel_file(*args: object, **kwargs: object) -> pd.ExcelFile:
+        raise AssertionError("workbook should not be parsed when every sheet is cached")
+
+    monkeypatch.setattr(pd, "ExcelFile", failing_excel_file)
+    second = data.load_pede_workbook_raw(workbook_path)
+
+    assert list(second) == [2022, 2023, 2024]
+    for year in (2022, 2023, 2024):
+        pd.testing.assert_frame_equal(second[year], first[year])
+
+
+def test_load_pede_workbook_raw_thread_pool_matches_serial(tmp_path: Path) -> None:
+    workbook_path = _write_workbook(
+        tmp_path,
+        {
+            "PEDE2022": pd.DataFrame({"RA": [1, 2], "Defas": [-1, 0]}),
+            "PEDE2023": pd.DataFrame({"RA": [1], "Defasagem": [0]}),
+            "PEDE2024": pd.DataFrame({"RA": [3], "Defasagem": [1]}),
+        },
+    )
+
+    serial = data.load_pede_workbook_raw(workbook_path)
+    threaded = data.load_pede_workbook_raw(workbook_path, max_workers=3)
+
+    assert list(threaded) == list(serial)
+    for year in serial:
+        pd.testing.assert_frame_equal(threaded[year], serial[year])
+
+
 def test_load_pede_workbook_wrapper_keeps_standardization_contract(tmp_path: Path) -> None:
     workbook_path = _write_workbook(
         tmp_path,
@@ -281,6 +351,24 @@ def test_load_pede_workbook_wrapper_keeps_standardization_contract(tmp_path: Pat
     assert datasets[2022]["INDE"].isna().all()
 
 
+def test_load_pede_workbook_thread_pool_matches_serial(tmp_path: Path) -> None:
+    workbook_path = _write_workbook(
+        tmp_path,
+        {
+            "PEDE2022": pd.DataFrame({"RA": [1, 2], "Defas": [-1, 0], "INDE 22": [5.0, 6.0]}),
+            "PEDE2023": pd.DataFrame({"RA": [1], "Defasagem": [0], "INDE 2023": [0.5]}),
+            "PEDE2024": pd.DataFrame({"RA": [2], "Defasagem": [1], "INDE 2024": [0.7]}),
+        },
+    )
+
+    serial = data.load_pede_workbook(workbook_path)
+    threaded = data.load_pede_workbook(workbook_path, max_workers=3)
+
+    assert list(threaded) == list(serial)
+    for year in serial:
+        pd.testing.assert_frame_equal(threaded[year], serial[year])
+
+
 def test_load_pede_workbook_with_metadata_returns_schema_and_coercion_reports(
     tmp_path: Path,
 ) -> None:
@@ -306,3 +394,24 @@ def test_load_pede_workbook_with_metadata_returns_schema_and_coercion_reports(
     assert "Defasagem" in metadata["original_columns"][2022]
     assert coercion[2022]["numeric_columns"]["INDE"]["n_invalid_tokens_replaced"] == 1
     assert "Fase" not in coercion[2022]["numeric_columns"]
+
+
+def test_load_pede_workbook_with_metadata_can_persist_report_async(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    workbook_path = _write_workbook(
+        tmp_path,
+        {
+            "PEDE2022": pd.DataFrame({"RA": [1], "Defas": [-1], "Fase": ["A"]}),
+            "PEDE2023": pd.DataFrame({"RA": [1], "Defasagem": [0]}),
+            "PEDE2024": pd.DataFrame({"RA": [1], "Defasagem": [1]}),
+        },
+    )
+    monkeypatch.chdir(tmp_path)
+
+    _, metadata, _ = data.load_pede_workbook_with_metadata(workbook_path, persist_async=True)
+    data.wait_for_report_writes()
+
+    report_path = tmp_path / "artifacts" / "category_normalization_report.json"
+    assert report_path.exists()
+    assert "category_report" in metadata
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pandas as pd
 
 from src.dtypes import parse_age_series, standardize_dtypes
@@ -23,6 +25,41 @@ def test_standardize_dtypes_data_nasc_string_to_datetime() -> None:
     assert result.loc[0, "Data_Nasc"] == pd.Timestamp("2008-05-10")
 
 
+def test_standardize_dtypes_data_nasc_mixed_sources_keep_row_alignment() -> None:
+    df = pd.DataFrame(
+        {
+            "RA": ["1", "2", "3", "4", "5", "6"],
+            "Data_Nasc": [
+                "15/03/2010",
+                2011,
+                None,
+                datetime(2009, 7, 1),
+                " ",
+                "2012",
+            ],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+    result, report = standardize_dtypes(df, year=2024)
+
+    assert result["Data_Nasc"].tolist() == [
+        pd.Timestamp("2010-03-15"),
+        pd.Timestamp("2011-01-01"),
+        pd.NaT,
+        pd.Timestamp("2009-07-01"),
+        pd.NaT,
+        pd.Timestamp("2012-01-01"),
+    ]
+    assert report["data_nasc_sources"] == {
+        "year": 2,
+        "excel_serial": 0,
+        "string": 1,
+        "datetime": 1,
+    }
+    assert report["n_nat_data_nasc"] == 2
+
+
 def test_parse_age_series_parses_common_valid_age_formats() -> None:
     series = pd.Series(["12", " 12 ", "12.0", "12,0", "12 anos"])
 
@@ -108,3 +145,32 @@ def test_standardize_dtypes_strips_categorical_columns_as_string_dtype() -> None
     assert str(result["Turma"].dtype) == "string"
     assert result.loc[0, "Turma"] == "A1"
     assert pd.isna(result.loc[1, "Turma"])
+
+
+def test_parse_age_series_keeps_nullable_integer_ages() -> None:
+    series = pd.Series([12, None, 40], dtype="Int64")
+
+    parsed, report = parse_age_series(series, year=2024)
+
+    assert parsed.tolist() == [12, pd.NA, pd.NA]
+    assert report["n_parsed_numeric_ok"] == 2
+    assert report["n_out_of_range"] == 1
+    assert report["n_invalid_tokens"] == 0
+
+
+def test_standardize_dtypes_result_does_not_share_memory_with_input() -> None:
+    df = pd.DataFrame(
+        {
+            "RA": ["1", "2"],
+            "IAA": pd.array([1.5, 2.5], dtype="Float64"),
+            "Data_Nasc": pd.to_datetime(["2010-01-02", "2011-03-04"]),
+        }
+    )
+    snapshot = df.copy()
+
+    result, _ = standardize_dtypes(df, year=2022)
+    result.loc[0, "IAA"] = 9.9
+    result.loc[0, "Data_Nasc"] = pd.NaT
+
+    pd.testing.assert_frame_equal(df, snapshot)
+    assert list(result.columns) == list(df.columns)
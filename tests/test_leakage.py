@@ -60,3 +60,13 @@ def test_returns_only_names_no_values() -> None:
     assert all(isinstance(name, str) for name in report["suspect_columns"])
     # Ensure cell values are not exposed in report payload.
     assert "999" not in str(report)
+
+
+def test_repeated_detection_returns_independent_reports() -> None:
+    X = pd.DataFrame({"Mat": [7.0], "Defasagem_y": [1.0], "INDE 2023": [5.0]})
+    first = detect_leakage_columns(X, year_t=2022, year_t1=2023, include_year_specific=True)
+    first["suspect_columns"].append("mutated")
+
+    second = detect_leakage_columns(X, year_t=2022, year_t1=2023, include_year_specific=True)
+    assert second["suspect_columns"] == ["Defasagem_y", "INDE 2023"]
+    assert detect_leakage_columns(X)["suspect_columns"] == ["Defasagem_y"]
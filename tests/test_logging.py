@@ -90,3 +90,23 @@ def test_file_handler_failure_keeps_stdout_logging(monkeypatch: pytest.MonkeyPat
 
     assert _count_project_handlers("project_stdout") == 1
     assert _count_project_handlers("project_file") == 0
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_matches_stdlib_layout(tmp_path, monkeypatch, use_orjson: bool) -> None:
+    import json
+
+    import src.utils as utils
+
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson not installed")
+
+    payload = {2022: {"label": "Ágata", "count": 3}, "pairs": [1, 2]}
+    path = tmp_path / "report.json"
+
+    utils.write_json(path, payload)
+
+    text = path.read_text(encoding="utf-8")
+    assert text == json.dumps(payload, ensure_ascii=False, indent=2)